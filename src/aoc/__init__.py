@@ -1,45 +1,487 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import functools
+import importlib.util
 import inspect
 import re
+import sys
 import textwrap
 import time
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
-from typing import ClassVar, List, Optional, Tuple, Union
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple,
+    Union)
+
+from aoc.stream import InputStream
+from aoc.trace import span
 
-import requests
+# keep `import aoc` cheap: instrumentation and networking are only imported
+# when they are used
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from random import Random
+
+    from aoc.bench import BenchmarkOptions, Stats
+    from aoc.inputs import InputStore
+    from aoc.memory import MemoryUsage
+    from aoc.metrics import Metrics
+    from aoc.supervise import Supervised
 
 YEAR = 2021
 
+# `PartResult.part` of the shared `parse_input` step
+PARSE = 0
+
+EXAMPLE_MODES = ("check", "background", "once", "skip")
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import top-level module `name` on first attribute access.
+
+    Annotations that use the module must not be evaluated at import time, so
+    modules that use this need `from __future__ import annotations`.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+@dataclass
+class PartResult:
+    day: int
+    part: int
+    solution: Union[int, str, float, None]
+    wall_time: float
+    cpu_time: float
+    stats: Optional[Stats] = None
+    memory: Optional[MemoryUsage] = None
+    metrics: Optional[Metrics] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+    def __str__(self):
+        if self.error:
+            return f"Part {self.part} failed: {self.error}"
+        if self.cached:
+            return f"Part {self.part} solution: {self.solution} (cached)"
+        if self.stats:
+            timing = str(self.stats)
+        else:
+            timing = str(timedelta(seconds=self.wall_time))
+        if self.memory:
+            timing += f", {self.memory}"
+        if self.metrics:
+            timing += f", {self.metrics}"
+
+        if self.part == PARSE:
+            return f"Parsed input ({timing})"
+        return f"Part {self.part} solution: {self.solution} ({timing})"
+
 
 class Puzzle:
+    DAY: ClassVar[int] = None
+
+    # checked by `python -m aoc importtime`, the interpreter startup itself
+    # is not included
+    IMPORT_BUDGET_MS: ClassVar[float] = 50
+
+    # parse in the parent and pass NumPy arrays to batch workers through
+    # shared memory, see `aoc.batch`
+    SHARE_PARSED: ClassVar[bool] = False
+
+    # keep the parsed real input on disk with memory-mapped NumPy arrays, see
+    # `aoc.artifacts`
+    PERSIST: ClassVar[bool] = False
+    # smaller inputs parse faster than their artifacts load
+    PERSIST_MIN_BYTES: ClassVar[int] = 4096
+
+    # default scales of `generate` for `python -m aoc sweep`
+    SWEEP_SCALES: ClassVar[List[int]] = None
+
     EXAMPLE: ClassVar[str] = None
     EXAMPLE_SOLUTION_PART1: ClassVar[int] = None
     EXAMPLE_SOLUTION_PART2: ClassVar[int] = None
 
     EXAMPLES: ClassVar[List[Tuple[str, Optional[int], Optional[int]]]] = None
 
+    def __init__(self):
+        self._parse_cache: Dict[str, Any] = {}
+        # the real input, the only one that is persisted with `PERSIST`
+        self._persisted_input: Optional[str] = None
+
+    def parse_input(self, inp: str) -> Any:
+        raise NotImplementedError
+
+    def parsed(self, inp: str, mutable: bool = True) -> Any:
+        """
+        `parse_input(inp)`, parsed only once per input.
+
+        The cached structure is shared between both parts and all callers, so
+        NumPy arrays in it are read-only. With `mutable` the caller gets its
+        own deep copy which it may modify freely.
+        """
+        try:
+            data = self._parse_cache[inp]
+        except KeyError:
+            data = self._parse_cache[inp] = self._parse(inp)
+
+        return copy.deepcopy(data) if mutable else data
+
+    def _parse(self, inp: str) -> Any:
+        if not self.PERSIST or len(inp) < self.PERSIST_MIN_BYTES \
+                or inp != self._persisted_input:
+            with span("parse_input"):
+                return _freeze(self.parse_input(inp))
+
+        from aoc.artifacts import ArtifactCache
+
+        artifacts = ArtifactCache()
+        key = ArtifactCache.key(self._source(), inp)
+        with span("load artifact"):
+            data = artifacts.get(key)
+        if data is None:
+            with span("parse_input"):
+                data = _freeze(self.parse_input(inp))
+            with span("store artifact"):
+                artifacts.put(key, data)
+        return data
+
     def solve_part1(self, inp: str) -> Union[int, str, float]:
         raise NotImplementedError
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
         raise NotImplementedError
 
-    def solve(self):
-        examples = self._check_examples()
+    def generate(self, scale: int, rng: Random) -> str:
+        """
+        Random valid input whose size grows with `scale`, for `python -m aoc
+        sweep`. What `scale` counts (grid side, lines, ...) is up to the day.
+        """
+        raise NotImplementedError
+
+    # Optional single-pass variants, used by `solve(stream=True)`. They get
+    # the memory-mapped input file instead of its content.
+
+    def solve_part1_stream(self, inp: InputStream) -> Union[int, str, float]:
+        raise NotImplementedError
+
+    def solve_part2_stream(self, inp: InputStream) -> Union[int, str, float]:
+        raise NotImplementedError
+
+    @classmethod
+    def day(cls) -> int:
+        if cls.DAY is not None:
+            return cls.DAY
+
+        puzzle_file = Path(inspect.getfile(cls))
+        return int(re.findall(r"day(\d+)", puzzle_file.stem)[0])
+
+    def solve(self, history: bool = True, **options):
+        """
+        Solve and print the solutions. See `run` for the options.
+
+        With `history` the timings are appended to the benchmark history,
+        see `aoc.history`.
+        """
+        results = self.run(**options)
+        for result in results:
+            print(result)
+
+        if history:
+            import sqlite3
+
+            from aoc.history import History, git_revision
+
+            try:
+                db = History()
+                db.record(
+                    results,
+                    git_revision(Path(inspect.getfile(self.__class__)).parent),
+                    self.input_hash())
+                db.close()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Cannot record history: {e}", file=sys.stderr)
+
+    def run(
+            self,
+            benchmark: Optional[BenchmarkOptions] = None,
+            profile: Optional[Path] = None,
+            memory: bool = False,
+            stream: bool = False,
+            cache: bool = False,
+            examples: str = "check",
+            timeout: Optional[float] = None,
+            memory_limit: Optional[int] = None,
+            metrics: bool = False,
+            concurrent: bool = False,
+            variant: Optional[str] = None,
+            trace: Optional[Path] = None) -> List[PartResult]:
+        """
+        Check the examples and solve the real input.
+
+        `benchmark` measures every part repeatedly, `profile` is a directory
+        that gets a cProfile dump and collapsed stacks per part. `memory`
+        records the memory usage of `parse_input` and of each part; the
+        input is then parsed up front and reported as part `PARSE`.
+        `stream` uses the `solve_partN_stream` variants where available.
+        `cache` answers from the on-disk result cache when neither the
+        puzzle source nor the input changed since the last run.
+        `metrics` collects the counters and histograms of `aoc.metrics`
+        that the solvers record. `concurrent` parses the input up front
+        (reported as part `PARSE`) and solves the parts in parallel forked
+        processes that inherit the parsed input. `variant` picks the
+        `solve_partN_<variant>` solvers, "auto" the fastest one measured by
+        `python -m aoc variants` for inputs of similar size. `trace` is a
+        directory that gets the spans of `aoc.trace` as Chrome trace JSON.
+
+        `examples` selects how the examples are verified: "check" before
+        solving, "background" in worker processes while the real input is
+        solved, "once" only once per version of the puzzle source, or "skip".
+        """
+        if trace:
+            from aoc.trace import Tracer
+
+            with Tracer() as tracer:
+                try:
+                    return self.run(
+                        benchmark, profile, memory, stream, cache, examples,
+                        timeout, memory_limit, metrics, concurrent, variant)
+                finally:
+                    tracer.write(trace / f"day{self.day()}.trace.json")
+
+        if examples not in EXAMPLE_MODES:
+            raise ValueError(f"unknown examples mode {examples!r}")
+        if benchmark and (profile or memory or metrics):
+            raise ValueError("benchmark cannot be combined with profiling")
+        if cache and (benchmark or profile or memory or metrics):
+            raise ValueError("cache cannot be combined with measurements")
+
+        parts = self.parts()
+        if cache:
+            return self._run_cached(
+                parts, stream, examples, timeout, memory_limit, concurrent,
+                variant)
+
+        pending_examples = None
+        if examples == "check":
+            self._check_examples()
+        elif examples == "background":
+            pending_examples = self._check_examples_async()
+        elif examples == "once":
+            self._check_examples_once()
+
+        streamed = [
+            part for part in parts if stream and self._stream_solver(part)
+        ]
+
+        inp = None
+        if len(streamed) < len(parts):
+            inp = self._get_input()
+            with span("dedent/strip"):
+                inp = textwrap.dedent(inp).strip()
+            self._persisted_input = inp
 
-        inp = textwrap.dedent(self._get_input()).strip()
-        start = time.perf_counter()
-        solution1 = self.solve_part1(inp)
-        end = time.perf_counter()
+        results = []
+        if (memory or concurrent) and inp is not None \
+                and type(self).parse_input is not Puzzle.parse_input:
+            results.append(self._run_part(
+                PARSE, inp, memory=memory, metrics=metrics))
 
-        print(f"Part 1 solution: {solution1} ({timedelta(seconds=end - start)})")
+        children = []
+        for part in parts:
+            if part in streamed:
+                run_part = functools.partial(
+                    self._run_part, part, self.input_stream(), benchmark,
+                    profile, memory, metrics, stream=True)
+            else:
+                run_part = functools.partial(
+                    self._run_part, part, inp, benchmark, profile, memory,
+                    metrics, variant=variant)
 
-        if any(value2 is not None for _, _, value2 in examples):
-            start = time.perf_counter()
-            solution2 = self.solve_part2(inp)
-            end = time.perf_counter()
+            if concurrent:
+                from aoc.supervise import Supervised
 
-            print(f"Part 2 solution: {solution2} ({timedelta(seconds=end - start)})")
+                children.append((part, Supervised(run_part, memory_limit)))
+            elif timeout is None and memory_limit is None:
+                results.append(run_part())
+            else:
+                results.append(self._run_supervised(
+                    part, run_part, timeout, memory_limit))
+
+        for part, child in children:
+            results.append(self._supervised_result(part, child, timeout))
+
+        if pending_examples:
+            for future in pending_examples:
+                future.result()
+        return results
+
+    def _run_supervised(
+            self,
+            part: int,
+            run_part: Callable[[], PartResult],
+            timeout: Optional[float],
+            memory_limit: Optional[int]) -> PartResult:
+        from aoc.supervise import Supervised
+
+        return self._supervised_result(
+            part, Supervised(run_part, memory_limit), timeout)
+
+    def _supervised_result(
+            self,
+            part: int,
+            child: Supervised[PartResult],
+            timeout: Optional[float]) -> PartResult:
+        try:
+            return child.result(timeout)
+        except RuntimeError as e:
+            return PartResult(
+                day=self.day(),
+                part=part,
+                solution=None,
+                wall_time=time.perf_counter() - child.start,
+                cpu_time=0.0,
+                error=str(e).strip())
+
+    def _run_cached(
+            self,
+            parts: List[int],
+            stream: bool,
+            examples: str,
+            timeout: Optional[float],
+            memory_limit: Optional[int],
+            concurrent: bool,
+            variant: Optional[str]) -> List[PartResult]:
+        from aoc.resultcache import ResultCache
+
+        result_cache = ResultCache()
+        source = self._source()
+        input_path = self.input_path()
+        keys = {
+            part: ResultCache.key(source, input_path, part) for part in parts
+        }
+
+        results = []
+        for part in parts:
+            hit, solution = result_cache.get(keys[part])
+            if not hit:
+                break
+            results.append(PartResult(
+                day=self.day(),
+                part=part,
+                solution=solution,
+                wall_time=0.0,
+                cpu_time=0.0,
+                cached=True))
+        else:
+            return results
+
+        results = self.run(
+            stream=stream, examples=examples, timeout=timeout,
+            memory_limit=memory_limit, concurrent=concurrent, variant=variant)
+        for result in results:
+            # no entries for parse timings and failed parts
+            if result.part in keys and not result.error:
+                result_cache.put(keys[result.part], result.solution)
+        return results
+
+    def _run_part(
+            self,
+            part: int,
+            inp: str,
+            benchmark: Optional[BenchmarkOptions] = None,
+            profile: Optional[Path] = None,
+            memory: bool = False,
+            metrics: bool = False,
+            stream: bool = False,
+            variant: Optional[str] = None) -> PartResult:
+        if stream:
+            solver = self._stream_solver(part)
+        elif part == PARSE:
+            solver = functools.partial(self.parsed, mutable=False)
+        else:
+            if variant == "auto":
+                from aoc.variants import fastest
+
+                variant = fastest(type(self), part, len(inp))
+            solver = self._variant_solver(part, variant)
+        if profile:
+            from aoc.profiling import profile_call
+
+            name = f"day{self.day()}-part{part}"
+            solver = functools.partial(profile_call, profile, name, solver)
+
+        if benchmark:
+            from aoc.bench import measure
+
+            with span(f"part {part}", runs=benchmark.warmup + benchmark.repeat):
+                solution, stats, cpu_time = measure(
+                    lambda: solver(inp), benchmark)
+            return PartResult(
+                day=self.day(),
+                part=part,
+                solution=_plain(solution),
+                wall_time=stats.median,
+                cpu_time=cpu_time,
+                stats=stats)
+
+        if memory:
+            from aoc.memory import MemoryProbe
+
+            probe = MemoryProbe()
+        else:
+            probe = nullcontext()
+        if metrics:
+            from aoc.metrics import Collector
+
+            collector = Collector()
+        else:
+            collector = nullcontext()
+        with probe, collector, span("parse" if part == PARSE else f"part {part}"):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            solution = solver(inp)
+            cpu_end = time.process_time()
+            wall_end = time.perf_counter()
+
+        return PartResult(
+            day=self.day(),
+            part=part,
+            solution=None if part == PARSE else _plain(solution),
+            wall_time=wall_end - wall_start,
+            cpu_time=cpu_end - cpu_start,
+            memory=probe.usage if memory else None,
+            metrics=collector.metrics if metrics else None)
+
+    def _variant_solver(
+            self, part: int, variant: Optional[str] = None) -> Callable[[str], Any]:
+        if variant in (None, "default"):
+            return getattr(self, f"solve_part{part}")
+        if variant not in self.variants(part):
+            raise ValueError(
+                f"day {self.day()} part {part} has no variant {variant!r}")
+        return getattr(self, f"solve_part{part}_{variant}")
+
+    def _stream_solver(
+            self, part: int) -> Optional[Callable[[InputStream], Any]]:
+        name = f"solve_part{part}_stream"
+        if getattr(type(self), name) is getattr(Puzzle, name):
+            return None
+        return getattr(self, name)
 
     def lines_input(self, input: str) -> List[int]:
         return [int(line) for line in input.split("\n")]
@@ -47,59 +489,188 @@ class Puzzle:
     def ints_input(self, input: str) -> List[int]:
         return [int(line) for line in input.split("\n")]
 
-    def _check_examples(self):
+    @classmethod
+    def examples(cls) -> List[Tuple[str, Optional[int], Optional[int]]]:
         examples = []
 
-        if self.EXAMPLES:
-            examples.extend(self.EXAMPLES)
+        if cls.EXAMPLES:
+            examples.extend(cls.EXAMPLES)
 
-        if self.EXAMPLE:
+        if cls.EXAMPLE:
             examples.append((
-                self.EXAMPLE,
-                self.EXAMPLE_SOLUTION_PART1,
-                self.EXAMPLE_SOLUTION_PART2))
+                cls.EXAMPLE,
+                cls.EXAMPLE_SOLUTION_PART1,
+                cls.EXAMPLE_SOLUTION_PART2))
+
+        return examples
+
+    @classmethod
+    def variants(cls, part: int) -> List[str]:
+        """
+        "default" for `solve_partN` and the names of the alternative solvers
+        `solve_partN_<name>`, which must give the same answers.
+        """
+        prefix = f"solve_part{part}_"
+        return ["default"] + sorted(
+            name[len(prefix):] for name in dir(cls)
+            if name.startswith(prefix) and name != f"{prefix}stream")
 
-        for example, value1, value2 in examples:
-            self._check_example(example, value1, value2)
+    @classmethod
+    def parts(cls) -> List[int]:
+        # part 2 is only solved once its example passes
+        if any(value2 is not None for _, _, value2 in cls.examples()):
+            return [1, 2]
+        return [1]
+
+    def _check_examples(self):
+        examples = self.examples()
+
+        for i, (example, value1, value2) in enumerate(examples):
+            with span(f"example {i + 1}"):
+                self._check_example(example, value1, value2)
 
         return examples
 
+    def _check_examples_async(self) -> List[Future]:
+        """
+        Start checking every example in its own worker process.
+        """
+        import multiprocessing
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        examples = self.examples()
+        if not examples:
+            return []
+
+        # fork also works for puzzles defined in __main__
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(
+            "fork" if "fork" in methods else None)
+        executor = ProcessPoolExecutor(
+            max_workers=min(len(examples), os.cpu_count() or 1),
+            mp_context=context)
+        futures = [
+            executor.submit(_check_example, type(self), *example)
+            for example in examples
+        ]
+        executor.shutdown(wait=False)
+        return futures
+
+    def _check_examples_once(self):
+        import hashlib
+
+        from aoc.inputs import cache_dir, write_atomic
+
+        digest = hashlib.sha256(self._source()).hexdigest()
+        stamp = cache_dir() / "verified" / digest
+        if stamp.exists():
+            return
+
+        self._check_examples()
+        write_atomic(stamp, b"")
+
     def _check_example(
             self, example: str, value1: Optional[int], value2: Optional[int]):
         example = textwrap.dedent(example).strip()
 
-        if value1 is not None:
-            _assert_eq(value1, self.solve_part1(example), "example part 1")
-        if value2 is not None:
-            _assert_eq(value2, self.solve_part2(example), "example part 2")
+        for part, value in ((1, value1), (2, value2)):
+            if value is None:
+                continue
+            for variant in self.variants(part):
+                message = f"example part {part}"
+                if variant != "default":
+                    message += f" ({variant})"
+                _assert_eq(
+                    value, self._variant_solver(part, variant)(example), message)
+
+            solver = self._stream_solver(part)
+            if solver:
+                _assert_eq(
+                    value,
+                    solver(InputStream.from_text(example)),
+                    f"example part {part} (stream)")
+
+    def input_store(self) -> InputStore:
+        from aoc.inputs import InputStore, find_session_cookie
 
-    def _get_input(self) -> str:
         puzzle_file = Path(inspect.getfile(self.__class__))
-        day = re.findall(r"day(\d+)", puzzle_file.stem)[0]
+        return InputStore(
+            YEAR, session_cookie=find_session_cookie(puzzle_file.parent))
 
-        cache_file = puzzle_file.with_suffix(".txt")
-        if cache_file.exists():
-            return cache_file.read_text(encoding="utf-8")
+    def _source(self) -> bytes:
+        return Path(inspect.getfile(self.__class__)).read_bytes()
 
-        session_cookie = self._read_session_cookie(puzzle_file)
-        response = requests.get(
-            f"https://adventofcode.com/{YEAR}/day/{day}/input",
-            cookies={"session": session_cookie})
-        response.raise_for_status()
+    def _legacy_input_path(self) -> Path:
+        # inputs downloaded by older versions live next to the source file
+        return Path(inspect.getfile(self.__class__)).with_suffix(".txt")
 
-        cache_file.write_text(response.text, encoding="utf-8")
-        return response.text
+    def has_input(self) -> bool:
+        """
+        Whether the input is stored locally or can be downloaded.
+        """
+        if self._legacy_input_path().exists():
+            return True
+        from aoc.inputs import DEFAULT_BASE_URL
 
-    def _read_session_cookie(self, puzzle_file: Path):
-        path = puzzle_file.parent
-        while str(path) != path.root:
-            if (path / ".aocsession").exists():
-                return (path / ".aocsession").read_text().strip()
-            path = path.parent
+        store = self.input_store()
+        return (
+            store.path(self.day()) is not None
+            or store.session_cookie is not None
+            or store.base_url != DEFAULT_BASE_URL)
 
-        raise RuntimeError("did not found .aocsession file")
+    def input_path(self) -> Path:
+        legacy_file = self._legacy_input_path()
+        if legacy_file.exists():
+            return legacy_file
+
+        day = self.day()
+        store = self.input_store()
+        return store.path(day) or store.prefetch([day])[day]
+
+    def input_hash(self) -> str:
+        from aoc.resultcache import file_digest
+
+        return file_digest(self.input_path()).hex()
+
+    def input_stream(self) -> InputStream:
+        return InputStream.from_path(self.input_path())
+
+    def _get_input(self) -> str:
+        with span("load input"):
+            return self.input_path().read_text(encoding="utf-8")
+
+
+def _check_example(
+        puzzle_cls: type,
+        example: str,
+        value1: Optional[int],
+        value2: Optional[int]):
+    puzzle_cls()._check_example(example, value1, value2)
 
 
 def _assert_eq(expected, actual, message):
     if actual != expected:
         raise AssertionError(f"{message}: Expected {expected}, got {actual}")
+
+
+def _freeze(value: Any) -> Any:
+    if hasattr(value, "setflags"):
+        value.setflags(write=False)
+    elif dataclasses.is_dataclass(value):
+        for field in dataclasses.fields(value):
+            _freeze(getattr(value, field.name))
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    return value
+
+
+def _plain(value):
+    # numpy scalars (e.g. from np.sum) are not JSON serializable
+    if hasattr(value, "item"):
+        return value.item()
+    return value
@@ -0,0 +1,407 @@
+import argparse
+import importlib
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from aoc import EXAMPLE_MODES, YEAR, Puzzle, importtime, runner, sweep
+from aoc.inputs import InputStore, find_session_cookie
+from aoc.bench import BenchmarkOptions
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    modules = args.days or runner.find_puzzles(args.src)
+
+    previous = None
+    if args.json and args.json.exists():
+        previous = runner.read_json(args.json)
+
+    options = {"examples": args.examples}
+    if args.profile:
+        options["profile"] = args.profile.resolve()
+    if args.trace:
+        options["trace"] = args.trace.resolve()
+    if args.memory:
+        options["memory"] = True
+    if args.stream:
+        options["stream"] = True
+    if args.metrics:
+        options["metrics"] = True
+    if args.concurrent:
+        options["concurrent"] = True
+    if args.variant:
+        options["variant"] = args.variant
+    if args.cache:
+        options["cache"] = True
+    if args.timeout is not None:
+        options["timeout"] = args.timeout
+    if args.memory_limit is not None:
+        options["memory_limit"] = args.memory_limit
+    if args.bench:
+        options["benchmark"] = BenchmarkOptions(
+            warmup=args.warmup,
+            repeat=args.repeat,
+            disable_gc=args.no_gc,
+            cpu=args.cpu)
+
+    reports = runner.run_all(
+        modules,
+        jobs=args.jobs,
+        options=options,
+        src_dir=args.src,
+        previous=previous)
+
+    if args.json:
+        runner.write_json(reports, args.json)
+    if args.csv:
+        runner.write_csv(reports, args.csv)
+    if not args.no_history:
+        from aoc.history import History, git_revision
+
+        db = History()
+        revision = git_revision(args.src)
+        for report in reports:
+            if report.input_hash:
+                db.record(report.parts, revision, report.input_hash)
+        db.close()
+
+    failed = any(
+        report.error or any(part.error for part in report.parts)
+        for report in reports)
+    return 1 if failed else 0
+
+
+def cmd_prefetch(args: argparse.Namespace) -> int:
+    modules = args.days or runner.find_puzzles(args.src)
+    days = [int(module[3:]) for module in modules]
+
+    store = InputStore(
+        YEAR,
+        root=args.cache_dir,
+        base_url=args.base_url,
+        session_cookie=find_session_cookie(args.src))
+    missing = store.missing(days)
+    for day, path in sorted(store.prefetch(missing, jobs=args.jobs).items()):
+        print(f"day{day}: {path}")
+    return 0
+
+
+def cmd_importtime(args: argparse.Namespace) -> int:
+    modules = args.days or runner.find_puzzles(args.src)
+    results = importtime.check(modules, args.src, repeat=args.repeat)
+    for result in results:
+        print(result)
+    return 1 if any(result.over_budget for result in results) else 0
+
+
+def cmd_sweep(args: argparse.Namespace) -> int:
+    sys.path.insert(0, str(args.src))
+    puzzle_cls = importlib.import_module(args.day).Puzzle
+    if puzzle_cls.generate is Puzzle.generate:
+        print(f"{args.day} has no input generator (Puzzle.generate)",
+              file=sys.stderr)
+        return 2
+    scales = args.scales or puzzle_cls.SWEEP_SCALES
+    if not scales:
+        print(f"{args.day} has no default scales, use --scales", file=sys.stderr)
+        return 2
+
+    points = sweep.sweep(puzzle_cls, scales, repeat=args.repeat, seed=args.seed)
+    for point in points:
+        print(f"scale {point.scale:>8} size {point.size:>10} "
+              f"part {point.part} {point.wall_time:.6f}s")
+    by_scale = sweep.exponents(points, by="scale")
+    for part, exponent in sweep.exponents(points).items():
+        print(f"part {part}: O(n^{exponent:.2f}) in input bytes, "
+              f"O(s^{by_scale[part]:.2f}) in scale")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(point) for point in points], indent=2),
+            encoding="utf-8")
+    return 0
+
+
+def cmd_history_trend(args: argparse.Namespace) -> int:
+    from aoc.history import History
+
+    day = int(args.day[3:]) if args.day else None
+    for timing in History(args.db).trend(day, args.part, args.host):
+        print(f"{timing.revision:<20} day{timing.day} part {timing.part} "
+              f"min {timing.min:.6f}s median {timing.median:.6f}s "
+              f"({timing.runs} runs)")
+    return 0
+
+
+def cmd_history_diff(args: argparse.Namespace) -> int:
+    from aoc.history import History
+
+    db = History(args.db)
+    revisions = db.revisions()
+    old = _find_revision(revisions, args.old, -2)
+    new = _find_revision(revisions, args.new, -1)
+    if old is None or new is None:
+        print("revision not found in history", file=sys.stderr)
+        return 2
+
+    print(f"{old} -> {new}")
+    for before, after in db.diff(old, new, args.host):
+        print(f"day{before.day} part {before.part}: {before.min:.6f}s -> "
+              f"{after.min:.6f}s ({after.min / before.min - 1:+.0%})")
+    return 0
+
+
+def cmd_history_regressions(args: argparse.Namespace) -> int:
+    from aoc.history import History
+
+    regressions = History(args.db).regressions(args.threshold, args.host)
+    for regression in regressions:
+        print(f"day{regression.day} part {regression.part}: "
+              f"{regression.before.revision} -> {regression.after.revision} "
+              f"{regression.before.min:.6f}s -> {regression.after.min:.6f}s "
+              f"({regression.ratio - 1:+.0%})")
+    return 1 if regressions else 0
+
+
+def _find_revision(
+        revisions: List[str], prefix: Optional[str], default: int) -> Optional[str]:
+    if prefix is None:
+        return revisions[default] if len(revisions) >= -default else None
+    matches = [revision for revision in revisions if revision.startswith(prefix)]
+    return matches[-1] if matches else None
+
+
+def cmd_variants(args: argparse.Namespace) -> int:
+    from random import Random
+
+    from aoc import variants
+
+    sys.path.insert(0, str(args.src))
+    puzzle_cls = importlib.import_module(args.day).Puzzle
+    if args.scales and puzzle_cls.generate is Puzzle.generate:
+        print(f"{args.day} has no input generator (Puzzle.generate)",
+              file=sys.stderr)
+        return 2
+    puzzle_cls()._check_examples()
+
+    inputs = []
+    if puzzle_cls().has_input():
+        inputs.append(puzzle_cls().input_path().read_text(encoding="utf-8").strip())
+    for scale in args.scales or puzzle_cls.SWEEP_SCALES or []:
+        inputs.append(puzzle_cls().generate(scale, Random(args.seed)))
+    if not inputs:
+        print(f"{args.day} has no input to compare the variants on",
+              file=sys.stderr)
+        return 2
+
+    try:
+        timings = variants.compare(puzzle_cls, inputs, repeat=args.repeat)
+    except AssertionError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    for timing in timings:
+        print(f"size {timing.size:>10} part {timing.part} "
+              f"{timing.variant:<12} {timing.wall_time:.6f}s")
+    if not args.no_save:
+        variants.save_profile(puzzle_cls, timings)
+    return 0
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    from aoc import daemon
+
+    daemon.serve(args.socket, args.src)
+    return 0
+
+
+def cmd_request(args: argparse.Namespace) -> int:
+    from aoc import daemon
+
+    results = daemon.request(
+        int(args.day[3:]), args.part, args.input, args.examples, args.socket)
+    for result in results:
+        print(result)
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    from aoc import batch
+
+    sys.path.insert(0, str(args.src))
+    puzzle_cls = importlib.import_module(args.day).Puzzle
+    results = batch.solve_many(
+        puzzle_cls, args.inputs, pattern=args.pattern, jobs=args.jobs)
+
+    for result in results:
+        if result.error:
+            print(f"{result.path}: FAILED ({result.error.strip().splitlines()[-1]})")
+        for part in result.parts:
+            print(f"{result.path}: {part}")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(result) for result in results], indent=2),
+            encoding="utf-8")
+    return 1 if any(result.error for result in results) else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="solve all days in parallel")
+    run.add_argument("days", nargs="*", help="modules to run, e.g. day15")
+    run.add_argument("-j", "--jobs", type=int, help="number of worker processes")
+    run.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    run.add_argument("--json", type=Path, help="write JSON report")
+    run.add_argument("--csv", type=Path, help="write CSV report")
+    run.add_argument(
+        "--profile", type=Path, metavar="DIR",
+        help="write cProfile stats and collapsed stacks per part to DIR")
+    run.add_argument(
+        "--trace", type=Path, metavar="DIR",
+        help="write a Chrome trace of the phases of each day to DIR")
+    run.add_argument(
+        "--memory", action="store_true",
+        help="record tracemalloc peak and RSS growth per part")
+    run.add_argument(
+        "--metrics", action="store_true",
+        help="collect the work counters the solvers record")
+    run.add_argument(
+        "--concurrent", action="store_true",
+        help="parse once, then solve the parts of a day in parallel processes")
+    run.add_argument(
+        "--variant",
+        help="solve with the solve_partN_VARIANT solvers, or 'auto' for the "
+             "fastest measured by the variants command")
+    run.add_argument(
+        "--stream", action="store_true",
+        help="use the single-pass solvers on the memory-mapped input")
+    run.add_argument(
+        "--examples", choices=EXAMPLE_MODES, default="check",
+        help="how to verify the examples (default: %(default)s)")
+    run.add_argument(
+        "--cache", action="store_true",
+        help="reuse answers of unchanged days from the result cache")
+    run.add_argument(
+        "--no-history", action="store_true",
+        help="do not append the timings to the benchmark history")
+    budget = run.add_argument_group("budgets")
+    budget.add_argument(
+        "--timeout", type=float, metavar="SECONDS",
+        help="kill a part after this wall-clock time")
+    budget.add_argument(
+        "--memory-limit", type=int, metavar="MB",
+        help="kill a part when it allocates more than this")
+    bench = run.add_argument_group("benchmark")
+    bench.add_argument(
+        "--bench", action="store_true", help="measure each part repeatedly")
+    bench.add_argument("--warmup", type=int, default=1)
+    bench.add_argument("--repeat", type=int, default=10)
+    bench.add_argument(
+        "--no-gc", action="store_true", help="disable GC while measuring")
+    bench.add_argument(
+        "--cpu", type=int, help="pin workers to this core (use with -j 1)")
+    run.set_defaults(func=cmd_run)
+
+    prefetch = subparsers.add_parser(
+        "prefetch", help="download all missing inputs concurrently")
+    prefetch.add_argument("days", nargs="*", help="modules to fetch, e.g. day15")
+    prefetch.add_argument("-j", "--jobs", type=int, default=8)
+    prefetch.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    prefetch.add_argument("--cache-dir", type=Path, help="input store directory")
+    prefetch.add_argument("--base-url", help="server to fetch inputs from")
+    prefetch.set_defaults(func=cmd_prefetch)
+
+    imports = subparsers.add_parser(
+        "importtime", help="check import times against the budget of each day")
+    imports.add_argument("days", nargs="*", help="modules to check, e.g. day15")
+    imports.add_argument("--repeat", type=int, default=3)
+    imports.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    imports.set_defaults(func=cmd_importtime)
+
+    sweeps = subparsers.add_parser(
+        "sweep", help="time a day on generated inputs of growing size")
+    sweeps.add_argument("day", help="module to sweep, e.g. day15")
+    sweeps.add_argument("--scales", type=int, nargs="+")
+    sweeps.add_argument("--repeat", type=int, default=3)
+    sweeps.add_argument("--seed", type=int, default=0)
+    sweeps.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    sweeps.add_argument("--json", type=Path, help="write measurements")
+    sweeps.set_defaults(func=cmd_sweep)
+
+    batches = subparsers.add_parser(
+        "batch", help="solve one day for every input in a directory")
+    batches.add_argument("day", help="module to run, e.g. day15")
+    batches.add_argument("inputs", type=Path, help="directory with inputs")
+    batches.add_argument("--pattern", default="*.txt")
+    batches.add_argument("-j", "--jobs", type=int)
+    batches.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    batches.add_argument("--json", type=Path, help="write results")
+    batches.set_defaults(func=cmd_batch)
+
+    variant = subparsers.add_parser(
+        "variants",
+        help="cross-check and time the solver variants of a day on the real "
+             "and generated inputs")
+    variant.add_argument("day", help="module to check, e.g. day15")
+    variant.add_argument(
+        "--scales", type=int, nargs="+",
+        help="scales of the generated inputs (default: SWEEP_SCALES)")
+    variant.add_argument("--repeat", type=int, default=3)
+    variant.add_argument("--seed", type=int, default=0)
+    variant.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    variant.add_argument(
+        "--no-save", action="store_true",
+        help="do not store the timings for --variant auto")
+    variant.set_defaults(func=cmd_variants)
+
+    daemons = subparsers.add_parser(
+        "daemon", help="serve solve requests with all days imported")
+    daemons.add_argument("--socket", type=Path, help="Unix socket to listen on")
+    daemons.add_argument("--src", type=Path, default=runner.SRC_DIR)
+    daemons.set_defaults(func=cmd_daemon)
+
+    requests = subparsers.add_parser(
+        "request", help="solve a day in the running daemon")
+    requests.add_argument("day", help="module to solve, e.g. day15")
+    requests.add_argument("--part", type=int)
+    requests.add_argument("--input", type=Path, help="input file to solve")
+    requests.add_argument(
+        "--examples", choices=("check", "once", "skip"), default="once")
+    requests.add_argument("--socket", type=Path)
+    requests.set_defaults(func=cmd_request)
+
+    history = subparsers.add_parser(
+        "history", help="query the benchmark history")
+    history.add_argument("--db", type=Path, help="history database")
+    history.add_argument("--host", help="host to show (default: this one)")
+    queries = history.add_subparsers(dest="query", required=True)
+
+    trend = queries.add_parser("trend", help="timings per revision")
+    trend.add_argument("day", nargs="?", help="module, e.g. day18")
+    trend.add_argument("--part", type=int)
+    trend.set_defaults(func=cmd_history_trend)
+
+    diff = queries.add_parser("diff", help="compare two revisions")
+    diff.add_argument(
+        "old", nargs="?", help="revision prefix (default: second to last)")
+    diff.add_argument("new", nargs="?", help="revision prefix (default: last)")
+    diff.set_defaults(func=cmd_history_diff)
+
+    regressions = queries.add_parser(
+        "regressions", help="revisions where a part got slower")
+    regressions.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="relative slowdown to report (default: %(default)s)")
+    regressions.set_defaults(func=cmd_history_regressions)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
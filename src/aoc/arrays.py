@@ -0,0 +1,55 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+
+@dataclass(frozen=True)
+class ArrayRef:
+    index: int
+
+
+def split_arrays(value: Any) -> Tuple[Any, List[Any]]:
+    """
+    Take the NumPy arrays out of a parsed input.
+
+    Returns a template in which every array is replaced by an `ArrayRef`,
+    and the arrays. Arrays are found at the top level and in dataclass
+    fields, lists and tuples.
+    """
+    arrays = []
+
+    def split(item: Any) -> Any:
+        if hasattr(item, "__array_interface__") and hasattr(item, "shape"):
+            arrays.append(item)
+            return ArrayRef(len(arrays) - 1)
+        if dataclasses.is_dataclass(item) and not isinstance(item, type):
+            return dataclasses.replace(item, **{
+                field.name: split(getattr(item, field.name))
+                for field in dataclasses.fields(item)
+                if field.init
+            })
+        if isinstance(item, (list, tuple)) and not hasattr(item, "_fields"):
+            return type(item)(split(element) for element in item)
+        return item
+
+    return split(value), arrays
+
+
+def join_arrays(template: Any, arrays: List[Any]) -> Any:
+    """
+    Inverse of `split_arrays`.
+    """
+    def join(item: Any) -> Any:
+        if isinstance(item, ArrayRef):
+            return arrays[item.index]
+        if dataclasses.is_dataclass(item) and not isinstance(item, type):
+            return dataclasses.replace(item, **{
+                field.name: join(getattr(item, field.name))
+                for field in dataclasses.fields(item)
+                if field.init
+            })
+        if isinstance(item, (list, tuple)) and not hasattr(item, "_fields"):
+            return type(item)(join(element) for element in item)
+        return item
+
+    return join(template)
@@ -0,0 +1,88 @@
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.arrays import join_arrays, split_arrays
+from aoc.inputs import cache_dir
+
+MAX_BYTES = 1 << 30
+
+
+class ArtifactCache:
+    """
+    Parsed inputs on disk, with their NumPy arrays as `.npy` files that are
+    memory-mapped read-only when loaded.
+
+    An entry is a directory `<key>/` with `template.pickle` (the parsed
+    value with `ArrayRef`s in place of the arrays, see `aoc.arrays`) and
+    `<index>.npy` per array. Least recently used entries are evicted.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = MAX_BYTES):
+        self.root = root or cache_dir() / "parsed"
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(source: bytes, inp: str) -> str:
+        # a changed parser must not see artifacts of the old one
+        digest = hashlib.sha256(source)
+        digest.update(b"\0")
+        digest.update(inp.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        import numpy as np
+
+        path = self.root / key
+        try:
+            template = pickle.loads((path / "template.pickle").read_bytes())
+            arrays = [
+                np.load(path / f"{index}.npy", mmap_mode="r").view(np.ndarray)
+                for index in range(len(list(path.glob("*.npy"))))
+            ]
+        except (OSError, ValueError, pickle.UnpicklingError):
+            return None
+
+        os.utime(path)  # mark as recently used
+        return join_arrays(template, arrays)
+
+    def put(self, key: str, value: Any) -> None:
+        import numpy as np
+
+        template, arrays = split_arrays(value)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=self.root, prefix=".tmp-"))
+        try:
+            for index, array in enumerate(arrays):
+                np.save(tmp / f"{index}.npy", array, allow_pickle=False)
+            (tmp / "template.pickle").write_bytes(pickle.dumps(template))
+            os.replace(tmp, self.root / key)
+        except (OSError, ValueError):
+            # another process stored the same entry first, or an array holds
+            # Python objects
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.root.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                size = sum(item.stat().st_size for item in path.iterdir())
+                entries.append((path.stat().st_mtime, size, path))
+            except OSError:
+                continue
+            total += size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
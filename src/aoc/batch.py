@@ -0,0 +1,183 @@
+import multiprocessing
+import os
+import sys
+import textwrap
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Type
+
+from aoc import PartResult, Puzzle
+from aoc.arrays import join_arrays, split_arrays
+
+# name, shape and dtype of an array in shared memory
+SharedArray = Tuple[str, Tuple[int, ...], str]
+
+_own_tracker = False
+
+
+@dataclass
+class InputResult:
+    path: str
+    parts: List[PartResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def solve_many(
+        puzzle_cls: Type[Puzzle],
+        input_dir: Path,
+        pattern: str = "*.txt",
+        jobs: Optional[int] = None) -> List[InputResult]:
+    """
+    Solve every input file in `input_dir` in a process pool.
+
+    For puzzles with `SHARE_PARSED` the inputs are parsed here and the
+    NumPy arrays are handed to the workers through shared memory instead of
+    being pickled, at most two inputs per worker ahead of the workers. All
+    other puzzles parse in the worker.
+    """
+    puzzle_cls()._check_examples()
+
+    paths = sorted(input_dir.glob(pattern))
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    # forked workers share the resource tracker of this process
+    own_tracker = context.get_start_method() != "fork"
+
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(list(sys.path), own_tracker)) as executor:
+        results: List[Optional[InputResult]] = [None] * len(paths)
+        pending = {}
+        queued = iter(enumerate(paths))
+        try:
+            while True:
+                # parse at most two inputs per worker ahead of the workers
+                for index, path in queued:
+                    blocks = []
+                    shared = None
+                    if puzzle_cls.SHARE_PARSED:
+                        try:
+                            shared = _share_parsed(puzzle_cls, path, blocks)
+                        except Exception:
+                            results[index] = InputResult(
+                                path=str(path), error=traceback.format_exc())
+                            continue
+                    future = executor.submit(
+                        _solve_input, puzzle_cls, str(path), shared)
+                    pending[future] = (index, blocks)
+                    if len(pending) >= 2 * workers:
+                        break
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, blocks = pending.pop(future)
+                    _unlink(blocks)
+                    results[index] = future.result()
+        finally:
+            for _, blocks in pending.values():
+                _unlink(blocks)
+        return results
+
+
+def _share_parsed(
+        puzzle_cls: Type[Puzzle],
+        path: Path,
+        blocks: List[shared_memory.SharedMemory]) -> Tuple[Any, List[SharedArray]]:
+    import numpy as np
+
+    inp = _read_input(path)
+    template, arrays = split_arrays(puzzle_cls().parsed(inp, mutable=False))
+    shared_arrays = []
+    try:
+        for array in arrays:
+            block = shared_memory.SharedMemory(
+                create=True, size=max(1, array.nbytes))
+            blocks.append(block)
+            shared_array = np.ndarray(
+                array.shape, dtype=array.dtype, buffer=block.buf)
+            shared_array[...] = array
+            del shared_array
+            shared_arrays.append((block.name, array.shape, array.dtype.str))
+    except BaseException:
+        _unlink(blocks)
+        raise
+    return template, shared_arrays
+
+
+def _unlink(blocks: List[shared_memory.SharedMemory]) -> None:
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _solve_input(
+        puzzle_cls: Type[Puzzle],
+        path: str,
+        shared: Optional[Tuple[Any, List[SharedArray]]]) -> InputResult:
+    import numpy as np
+
+    result = InputResult(path=path)
+    blocks = []
+    try:
+        puzzle = puzzle_cls()
+        inp = _read_input(Path(path))
+        if shared:
+            template, shared_arrays = shared
+            arrays = []
+            for name, shape, dtype in shared_arrays:
+                block = _attach(name)
+                blocks.append(block)
+                array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+                array.setflags(write=False)
+                arrays.append(array)
+            puzzle._parse_cache[inp] = join_arrays(template, arrays)
+            del arrays
+
+        result.parts = [puzzle._run_part(part, inp) for part in puzzle.parts()]
+        # views into the blocks must be gone before they can be closed
+        del puzzle
+    except Exception:
+        result.error = traceback.format_exc()
+
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # still referenced from a traceback, closed on exit
+            pass
+    return result
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Python < 3.13 registers attached blocks with the resource tracker,
+    # which unlinks them when the worker exits if it has its own tracker
+    block = shared_memory.SharedMemory(name=name)
+    if _own_tracker:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def _read_input(path: Path) -> str:
+    return textwrap.dedent(path.read_text(encoding="utf-8")).strip()
+
+
+def _init_worker(path: List[str], own_tracker: bool) -> None:
+    global _own_tracker
+
+    sys.path[:] = path
+    _own_tracker = own_tracker
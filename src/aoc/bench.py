@@ -0,0 +1,86 @@
+import gc
+import math
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BenchmarkOptions:
+    warmup: int = 1
+    repeat: int = 10
+    disable_gc: bool = False
+    cpu: Optional[int] = None
+
+
+@dataclass
+class Stats:
+    runs: int
+    min: float
+    median: float
+    p95: float
+    stddev: float
+
+    @classmethod
+    def from_samples(cls, samples: List[float]) -> "Stats":
+        ordered = sorted(samples)
+        return cls(
+            runs=len(ordered),
+            min=ordered[0],
+            median=statistics.median(ordered),
+            p95=ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)],
+            stddev=statistics.stdev(ordered) if len(ordered) > 1 else 0.0)
+
+    def __str__(self):
+        return f"min {self.min:.6f}s, median {self.median:.6f}s, " \
+               f"p95 {self.p95:.6f}s, stddev {self.stddev:.6f}s, " \
+               f"{self.runs} runs"
+
+
+def pin_cpu(cpu: int) -> None:
+    if not hasattr(os, "sched_setaffinity"):
+        raise RuntimeError("CPU pinning is not supported on this platform")
+    os.sched_setaffinity(0, {cpu})
+
+
+def measure(
+        fn: Callable[[], T],
+        options: BenchmarkOptions) -> Tuple[T, Stats, float]:
+    """
+    Call `fn` `options.warmup` times untimed and `options.repeat` times timed.
+
+    Returns the result of the last call, the wall time statistics and the
+    median CPU time.
+    """
+    if options.cpu is not None:
+        pin_cpu(options.cpu)
+
+    result = None
+    for _ in range(options.warmup):
+        result = fn()
+
+    gc_was_enabled = gc.isenabled()
+    if options.disable_gc:
+        gc.collect()
+        gc.disable()
+
+    wall_samples = []
+    cpu_samples = []
+    try:
+        for _ in range(max(1, options.repeat)):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            result = fn()
+            cpu_end = time.process_time()
+            wall_end = time.perf_counter()
+            wall_samples.append(wall_end - wall_start)
+            cpu_samples.append(cpu_end - cpu_start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return result, Stats.from_samples(wall_samples), statistics.median(cpu_samples)
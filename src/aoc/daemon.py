@@ -0,0 +1,139 @@
+"""
+Long-lived solver process that answers requests over a Unix socket.
+
+The protocol is one JSON object per line in each direction::
+
+    {"day": 15, "part": 2, "input": "/path/to/input.txt"}
+    {"results": [{"day": 15, "part": 2, "solution": 2935, ...}]}
+
+`part` (default: all parts) and `input` (default: the day's input) are
+optional, as is `examples`: "once" (default), "check" or "skip". Failures
+are answered with `{"error": "..."}`.
+"""
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import textwrap
+import traceback
+from dataclasses import asdict
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+from aoc import PartResult
+from aoc.inputs import cache_dir
+from aoc.runner import SRC_DIR, find_puzzles, read_part
+
+
+def default_socket() -> Path:
+    return cache_dir() / "daemon.sock"
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """
+    Serves requests one at a time with all day modules imported up front.
+
+    Modules are reloaded when their source file changed since the import.
+    """
+
+    def __init__(self, path: Path, src_dir: Path = SRC_DIR):
+        if str(src_dir) not in sys.path:
+            sys.path.insert(0, str(src_dir))
+        self.modules: Dict[int, ModuleType] = {}
+        self._mtimes: Dict[int, int] = {}
+        for name in find_puzzles(src_dir):
+            self._load(int(name[3:]), importlib.import_module(name))
+        _load_lazy_modules()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+        super().__init__(str(path), RequestHandler)
+
+    def solve(self, request: Dict[str, Any]) -> List[PartResult]:
+        day = int(request["day"])
+        if day not in self.modules:
+            raise ValueError(f"no puzzle for day {day}")
+        module = self.modules[day]
+        if os.stat(module.__file__).st_mtime_ns != self._mtimes[day]:
+            self._load(day, importlib.reload(module))
+
+        puzzle = self.modules[day].Puzzle()
+        examples = request.get("examples", "once")
+        if examples == "check":
+            puzzle._check_examples()
+        elif examples == "once":
+            puzzle._check_examples_once()
+        elif examples != "skip":
+            raise ValueError(f"unknown examples mode {examples!r}")
+
+        if request.get("input"):
+            inp = Path(request["input"]).read_text(encoding="utf-8")
+            inp = textwrap.dedent(inp).strip()
+        else:
+            inp = textwrap.dedent(puzzle._get_input()).strip()
+            puzzle._persisted_input = inp
+
+        parts = [int(request["part"])] if request.get("part") else puzzle.parts()
+        return [puzzle._run_part(part, inp) for part in parts]
+
+    def _load(self, day: int, module: ModuleType) -> None:
+        self.modules[day] = module
+        self._mtimes[day] = os.stat(module.__file__).st_mtime_ns
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: SolverServer
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                results = self.server.solve(json.loads(line))
+                response = {"results": [asdict(result) for result in results]}
+            except Exception:
+                response = {"error": traceback.format_exc()}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def serve(path: Optional[Path] = None, src_dir: Path = SRC_DIR) -> None:
+    path = path or default_socket()
+    with SolverServer(path, src_dir) as server:
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def request(
+        day: int,
+        part: Optional[int] = None,
+        input: Optional[Path] = None,
+        examples: str = "once",
+        path: Optional[Path] = None) -> List[PartResult]:
+    """
+    Solve a day in the daemon listening on `path`.
+    """
+    message = {"day": day, "part": part, "examples": examples}
+    if input:
+        message["input"] = str(Path(input).resolve())
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path or default_socket()))
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as fp:
+            response = json.loads(fp.readline())
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return [read_part(entry) for entry in response["results"]]
+
+
+def _load_lazy_modules() -> None:
+    # the first attribute access executes modules from `aoc.lazy_import`
+    for module in list(sys.modules.values()):
+        if type(module).__name__ == "_LazyModule":
+            dir(module)
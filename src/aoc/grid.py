@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def byte_grid(inp: Union[str, bytes]) -> np.ndarray:
+    """
+    Read-only `(rows, columns)` uint8 view of the bytes of a rectangular
+    block of text lines. Bytes are used without copying.
+    """
+    import numpy as np
+
+    if isinstance(inp, str):
+        inp = inp.encode("ascii")
+    data = np.frombuffer(inp, dtype=np.uint8)
+    if not len(data):
+        return data.reshape(0, 0)
+
+    width = inp.find(b"\n")
+    if width < 0:
+        width = len(inp)
+
+    rows, rest = divmod(len(data) + 1, width + 1)
+    if rest or np.any(data[width::width + 1] != ord("\n")):
+        raise ValueError("grid rows differ in length")
+
+    # skip the newlines with the row stride instead of copying
+    return np.lib.stride_tricks.as_strided(
+        data, shape=(rows, width), strides=(width + 1, 1), writeable=False)
+
+
+def digit_grid(inp: Union[str, bytes], dtype: str = "uint8") -> np.ndarray:
+    """
+    Grid of single digit numbers like "2199943210\\n3987894921".
+    """
+    grid = byte_grid(inp) - ord("0")
+    # bytes below "0" wrap around
+    if grid.size and grid.max() > 9:
+        raise ValueError("grid contains non-digits")
+    return grid.astype(dtype, copy=False)
+
+
+def char_grid(inp: Union[str, bytes], char: str = "#") -> np.ndarray:
+    """
+    Boolean grid that is true where the text has `char`.
+    """
+    return byte_grid(inp) == ord(char)
@@ -0,0 +1,189 @@
+import socket
+import sqlite3
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aoc import PARSE, PartResult
+from aoc.inputs import cache_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS timings (
+    timestamp REAL NOT NULL,
+    revision TEXT NOT NULL,
+    host TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    solution TEXT,
+    wall_time REAL NOT NULL,
+    cpu_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_day_part ON timings (day, part);
+"""
+
+
+@dataclass
+class RevisionTiming:
+    revision: str
+    day: int
+    part: int
+    runs: int
+    # best and median wall time of all runs of the revision
+    min: float
+    median: float
+
+
+@dataclass
+class Regression:
+    day: int
+    part: int
+    before: RevisionTiming
+    after: RevisionTiming
+
+    @property
+    def ratio(self) -> float:
+        return self.after.min / self.before.min
+
+
+def git_revision(path: Path) -> str:
+    """
+    Abbreviated commit of the checkout `path` is in, "-dirty" when it has
+    uncommitted changes, or "unknown" outside of git.
+    """
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=path, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class History:
+    """
+    SQLite log of part timings keyed by git revision, day, part, input hash
+    and host.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or cache_dir() / "history.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), timeout=30)
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def record(
+            self,
+            results: Iterable[PartResult],
+            revision: str,
+            input_hash: str,
+            host: Optional[str] = None) -> None:
+        """
+        Append the solved parts of `results`; cached, failed and parse
+        results are left out.
+        """
+        now = time.time()
+        rows = [
+            (now, revision, host or socket.gethostname(), result.day,
+             result.part, input_hash, str(result.solution), result.wall_time,
+             result.cpu_time)
+            for result in results
+            if result.part != PARSE and not result.cached and not result.error
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def revisions(self) -> List[str]:
+        """
+        All revisions, oldest first.
+        """
+        return [row[0] for row in self._connection.execute(
+            "SELECT revision FROM timings GROUP BY revision "
+            "ORDER BY MIN(timestamp)")]
+
+    def trend(
+            self,
+            day: Optional[int] = None,
+            part: Optional[int] = None,
+            host: Optional[str] = None) -> List[RevisionTiming]:
+        """
+        Timings per revision (oldest first), day and part.
+
+        Runs on other inputs than the latest one of a day are left out, as
+        they are not comparable.
+        """
+        query = "SELECT revision, day, part, input_hash, wall_time " \
+                "FROM timings WHERE host = ?"
+        args = [host or socket.gethostname()]
+        if day is not None:
+            query += " AND day = ?"
+            args.append(day)
+        if part is not None:
+            query += " AND part = ?"
+            args.append(part)
+        query += " ORDER BY timestamp"
+
+        latest_input: Dict[int, str] = {}
+        samples: Dict[Tuple[str, int, int], List[float]] = {}
+        rows = self._connection.execute(query, args).fetchall()
+        for _, row_day, _, input_hash, _ in rows:
+            latest_input[row_day] = input_hash
+        for revision, row_day, row_part, input_hash, wall_time in rows:
+            if input_hash == latest_input[row_day]:
+                samples.setdefault(
+                    (revision, row_day, row_part), []).append(wall_time)
+
+        return [
+            RevisionTiming(
+                revision=revision,
+                day=row_day,
+                part=row_part,
+                runs=len(times),
+                min=min(times),
+                median=statistics.median(times))
+            for (revision, row_day, row_part), times in samples.items()
+        ]
+
+    def diff(
+            self,
+            old: str,
+            new: str,
+            host: Optional[str] = None) -> List[Tuple[RevisionTiming, RevisionTiming]]:
+        """
+        Timings of the parts measured in both revisions.
+        """
+        timings = {
+            (timing.revision, timing.day, timing.part): timing
+            for timing in self.trend(host=host)
+        }
+        return [
+            (timing, timings[(new, day, part)])
+            for (revision, day, part), timing in sorted(timings.items())
+            if revision == old and (new, day, part) in timings
+        ]
+
+    def regressions(
+            self,
+            threshold: float = 0.2,
+            host: Optional[str] = None) -> List[Regression]:
+        """
+        Revisions whose best time of a part is more than `threshold` slower
+        than in the previously measured revision.
+        """
+        by_part: Dict[Tuple[int, int], List[RevisionTiming]] = {}
+        for timing in self.trend(host=host):
+            by_part.setdefault((timing.day, timing.part), []).append(timing)
+
+        regressions = []
+        for (day, part), timings in sorted(by_part.items()):
+            for before, after in zip(timings, timings[1:]):
+                if after.min > before.min * (1 + threshold):
+                    regressions.append(Regression(day, part, before, after))
+        return regressions
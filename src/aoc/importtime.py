@@ -0,0 +1,56 @@
+import importlib
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\S+)\s*$")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    time_ms: float
+    budget_ms: float
+
+    @property
+    def over_budget(self) -> bool:
+        return self.time_ms > self.budget_ms
+
+    def __str__(self):
+        status = "OVER BUDGET" if self.over_budget else "ok"
+        return f"{self.module}: {self.time_ms:.1f} ms " \
+               f"(budget {self.budget_ms:.0f} ms) {status}"
+
+
+def measure(module: str, src_dir: Path, repeat: int = 3) -> float:
+    """
+    Cumulative import time of `module` in milliseconds, including `aoc` and
+    everything else it imports. Best of `repeat` fresh interpreters.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=src_dir, capture_output=True, text=True, check=True)
+        for line in process.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if match and match.group(3) == module:
+                best = min(best, int(match.group(2)) / 1000)
+    return best
+
+
+def check(modules: List[str], src_dir: Path, repeat: int = 3) -> List[ImportTime]:
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+
+    return [
+        ImportTime(
+            module=module,
+            time_ms=measure(module, src_dir, repeat),
+            budget_ms=importlib.import_module(module).Puzzle.IMPORT_BUDGET_MS)
+        for module in modules
+    ]
@@ -0,0 +1,131 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_BASE_URL = "https://adventofcode.com"
+
+
+def cache_dir() -> Path:
+    if "AOC_CACHE_DIR" in os.environ:
+        return Path(os.environ["AOC_CACHE_DIR"])
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg_cache) if xdg_cache else Path.home() / ".cache") / "aoc"
+
+
+def find_session_cookie(path: Path) -> Optional[str]:
+    if "AOC_SESSION" in os.environ:
+        return os.environ["AOC_SESSION"]
+
+    path = path.resolve()
+    while str(path) != path.root:
+        if (path / ".aocsession").exists():
+            return (path / ".aocsession").read_text().strip()
+        path = path.parent
+    return None
+
+
+class InputStore:
+    """
+    Content-addressed puzzle input cache.
+
+    Inputs are stored as `objects/<sha256>` below `root`, `refs/<year>/dayN`
+    holds the digest of the input of a day.
+    """
+
+    def __init__(
+            self,
+            year: int,
+            root: Optional[Path] = None,
+            base_url: Optional[str] = None,
+            session_cookie: Optional[str] = None):
+        self.year = year
+        self.root = root or cache_dir() / "inputs"
+        self.base_url = (
+            base_url or os.environ.get("AOC_BASE_URL", DEFAULT_BASE_URL)
+        ).rstrip("/")
+        self.session_cookie = session_cookie
+
+    def path(self, day: int) -> Optional[Path]:
+        ref = self._ref_path(day)
+        if not ref.exists():
+            return None
+
+        obj = self._object_path(ref.read_text(encoding="ascii").strip())
+        return obj if obj.exists() else None
+
+    def get(self, day: int) -> str:
+        path = self.path(day) or self.prefetch([day])[day]
+        return path.read_text(encoding="utf-8")
+
+    def put(self, day: int, content: bytes) -> Path:
+        digest = hashlib.sha256(content).hexdigest()
+        obj = self._object_path(digest)
+        if not obj.exists():
+            write_atomic(obj, content)
+        write_atomic(self._ref_path(day), digest.encode("ascii"))
+        return obj
+
+    def missing(self, days: Iterable[int]) -> List[int]:
+        return [day for day in days if self.path(day) is None]
+
+    def prefetch(self, days: Iterable[int], jobs: int = 8) -> Dict[int, Path]:
+        """
+        Download all days that are not cached yet concurrently over one
+        pooled HTTP session.
+        """
+        paths = {day: self.path(day) for day in days}
+        missing = [day for day, path in paths.items() if path is None]
+        if not missing:
+            return paths
+
+        # requests takes longer to import than most days take to solve
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+        from requests.adapters import HTTPAdapter
+
+        jobs = max(1, min(jobs, len(missing)))
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=jobs)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if self.session_cookie:
+                session.cookies.set("session", self.session_cookie)
+            elif self.base_url == DEFAULT_BASE_URL:
+                raise RuntimeError("did not found .aocsession file")
+
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                fetched = executor.map(
+                    lambda day: self._fetch(session, day), missing)
+                paths.update(zip(missing, fetched))
+
+        return paths
+
+    def _fetch(self, session: "requests.Session", day: int) -> Path:
+        response = session.get(f"{self.base_url}/{self.year}/day/{day}/input")
+        response.raise_for_status()
+        return self.put(day, response.content)
+
+    def _ref_path(self, day: int) -> Path:
+        return self.root / "refs" / str(self.year) / f"day{day}"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
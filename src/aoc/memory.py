@@ -0,0 +1,61 @@
+import os
+import resource
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class MemoryUsage:
+    # peak of Python allocations in bytes, as seen by tracemalloc
+    peak: int
+    # growth of the resident set size in bytes
+    rss_delta: int
+
+    def __str__(self):
+        return f"peak {self.peak / 2**20:.1f} MiB, " \
+               f"RSS {self.rss_delta / 2**20:+.1f} MiB"
+
+
+class MemoryProbe:
+    """
+    Measures the memory used within a `with` block.
+
+    tracemalloc slows down allocation heavy code considerably, so timings
+    taken inside a probe are only good for rough comparisons.
+    """
+
+    def __init__(self):
+        self.usage: Optional[MemoryUsage] = None
+        self._rss = 0
+        self._traced = 0
+        self._was_tracing = False
+
+    def __enter__(self) -> "MemoryProbe":
+        self._was_tracing = tracemalloc.is_tracing()
+        if self._was_tracing:
+            self._traced = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        self._rss = current_rss()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        rss = current_rss()
+        peak = tracemalloc.get_traced_memory()[1] - self._traced
+        if not self._was_tracing:
+            tracemalloc.stop()
+        self.usage = MemoryUsage(peak=peak, rss_delta=rss - self._rss)
+
+
+def current_rss() -> int:
+    try:
+        with open("/proc/self/statm", "rb") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # no procfs: the maximum RSS is the best approximation available
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
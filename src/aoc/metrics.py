@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class Metrics:
+    counters: Dict[str, int] = field(default_factory=dict)
+    # value -> number of observations
+    histograms: Dict[str, Dict[int, int]] = field(default_factory=dict)
+
+    def __str__(self):
+        items = [f"{name}={value}" for name, value in self.counters.items()]
+        for name, histogram in self.histograms.items():
+            n = sum(histogram.values())
+            mean = sum(value * k for value, k in histogram.items()) / n
+            items.append(
+                f"{name}: n={n} mean={mean:.2f} max={max(histogram)}")
+        return ", ".join(items)
+
+
+_active: Optional[Metrics] = None
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Add `n` to counter `name`. Does nothing outside of a `Collector`.
+
+    In hot loops count in a local variable and call this once at the end.
+    """
+    if _active is not None:
+        _active.counters[name] = _active.counters.get(name, 0) + n
+
+
+def observe(name: str, value: int) -> None:
+    """
+    Add `value` to histogram `name`. Does nothing outside of a `Collector`.
+    """
+    if _active is not None:
+        histogram = _active.histograms.setdefault(name, {})
+        histogram[value] = histogram.get(value, 0) + 1
+
+
+class Collector:
+    """
+    Collects the counters and histograms recorded within a `with` block.
+    """
+
+    def __init__(self):
+        self.metrics = Metrics()
+        self._outer: Optional[Metrics] = None
+
+    def __enter__(self) -> "Collector":
+        global _active
+
+        self._outer = _active
+        _active = self.metrics
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active
+
+        _active = self._outer
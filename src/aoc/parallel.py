@@ -0,0 +1,55 @@
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+from aoc.stream import InputStream
+
+T = TypeVar("T")
+
+CHUNK_SIZE = 16 << 20
+
+
+def reduce_chunks(
+        stream: InputStream,
+        summarize: Callable[[bytes], T],
+        combine: Callable[[T, T], T],
+        initial: T,
+        jobs: Optional[int] = None,
+        chunk_size: Optional[int] = None) -> T:
+    """
+    `combine` the `summarize(chunk)` of all chunks of whole lines in input
+    order, starting with `initial`. `combine` must be associative.
+
+    File inputs are summarized in a process pool; each worker reads its
+    chunks from the memory-mapped file, so only offsets and summaries are
+    sent between processes. `summarize` must be picklable.
+
+    Inside daemonic processes, like the supervised children of
+    `aoc.supervise`, the chunks are summarized serially, as those cannot
+    start processes.
+    """
+    spans = stream.spans(chunk_size or CHUNK_SIZE)
+    jobs = min(jobs or os.cpu_count() or 1, len(spans))
+    if multiprocessing.current_process().daemon:
+        jobs = 1
+    if stream.path is None or jobs <= 1:
+        summaries = map(
+            lambda span: summarize(stream.read(*span)), spans)
+        return functools.reduce(combine, summaries, initial)
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        summaries = executor.map(
+            _summarize_span, repeat(summarize), repeat(stream.path),
+            *zip(*spans))
+        return functools.reduce(combine, summaries, initial)
+
+
+def _summarize_span(
+        summarize: Callable[[bytes], T], path: Path, start: int, end: int) -> T:
+    return summarize(InputStream.from_path(path).read(start, end))
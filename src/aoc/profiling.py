@@ -0,0 +1,78 @@
+import cProfile
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Func = Tuple[str, int, str]
+
+MAX_DEPTH = 256
+
+
+def profile_call(out_dir: Path, name: str, fn: Callable[..., T], *args) -> T:
+    """
+    Run `fn(*args)` under cProfile and write `<name>.pstats` and
+    `<name>.collapsed` to `out_dir`.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(str(out_dir / f"{name}.pstats"))
+    (out_dir / f"{name}.collapsed").write_text(
+        "".join(f"{stack} {weight}\n" for stack, weight in collapse(profiler)),
+        encoding="utf-8")
+    return result
+
+
+def collapse(profiler: cProfile.Profile) -> List[Tuple[str, int]]:
+    """
+    Collapsed stacks (`a;b;c <microseconds>`) for flamegraph tools.
+
+    cProfile only records caller/callee pairs, so the time of a function
+    called from several places is split among them proportionally to the
+    cumulative time of each call edge.
+    """
+    stats = pstats.Stats(profiler).stats
+
+    callees: Dict[Func, Dict[Func, tuple]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+
+    weights: Dict[str, float] = defaultdict(float)
+
+    def walk(func: Func, stack: List[Func], labels: List[str], share: float):
+        # cut off subtrees below one microsecond to bound the walk
+        if func in stack or len(stack) >= MAX_DEPTH \
+                or stats[func][3] * share < 1e-6:
+            return
+
+        stack.append(func)
+        labels.append(_label(func))
+        weights[";".join(labels)] += stats[func][2] * share
+        for callee, edge in callees[func].items():
+            cumtime = stats[callee][3]
+            if cumtime > 0:
+                walk(callee, stack, labels, share * edge[3] / cumtime)
+        labels.pop()
+        stack.pop()
+
+    for func, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            walk(func, [], [], 1.0)
+
+    return [
+        (stack, round(weight * 1e6))
+        for stack, weight in weights.items()
+        if round(weight * 1e6) > 0
+    ]
+
+
+def _label(func: Func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ",")
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from aoc.inputs import cache_dir, write_atomic
+
+MAX_BYTES = 16 << 20
+
+
+class ResultCache:
+    """
+    On-disk cache of puzzle answers with least-recently-used eviction.
+
+    Keys are derived from the puzzle source and the input content, so an
+    edited solver or a different input never sees a stale answer.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = MAX_BYTES):
+        self.root = root or cache_dir() / "results"
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(source: bytes, input_path: Path, part: int) -> str:
+        digest = hashlib.sha256(source)
+        digest.update(b"\0")
+        digest.update(file_digest(input_path))
+        digest.update(f"\0{part}".encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        `(True, answer)` on a hit, `(False, None)` otherwise.
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False, None
+
+        os.utime(path)  # mark as recently used
+        return True, entry["solution"]
+
+    def put(self, key: str, solution: Any) -> None:
+        write_atomic(
+            self._path(key),
+            json.dumps({"solution": solution}).encode("utf-8"))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+
+def file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
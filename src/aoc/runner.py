@@ -0,0 +1,182 @@
+import csv
+import importlib
+import json
+import os
+import re
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aoc import PARSE, PartResult
+from aoc.bench import Stats
+from aoc.memory import MemoryUsage
+from aoc.metrics import Metrics
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+CSV_FIELDS = [
+    "module", "day", "part", "solution", "wall_time", "cpu_time", "cached",
+    "runs", "min", "median", "p95", "stddev", "peak", "rss_delta", "metrics",
+    "error",
+]
+
+
+@dataclass
+class DayReport:
+    module: str
+    day: Optional[int]
+    parts: List[PartResult] = field(default_factory=list)
+    error: Optional[str] = None
+    input_hash: Optional[str] = None
+    # no input is available for the day
+    skipped: bool = False
+
+    @property
+    def wall_time(self) -> float:
+        return sum(part.wall_time for part in self.parts)
+
+
+def find_puzzles(src_dir: Path = SRC_DIR) -> List[str]:
+    """
+    Names of all modules `dayN` in `src_dir` that define a `Puzzle`.
+    """
+    modules = []
+    for path in src_dir.glob("day*.py"):
+        if not re.fullmatch(r"day\d+", path.stem):
+            continue
+        if "class Puzzle(" in path.read_text(encoding="utf-8"):
+            modules.append(path.stem)
+    return sorted(modules, key=lambda name: int(name[3:]))
+
+
+def run_puzzle(module: str, options: Optional[Dict] = None) -> DayReport:
+    report = DayReport(module=module, day=None)
+    try:
+        puzzle = importlib.import_module(module).Puzzle()
+        report.day = puzzle.day()
+        if not puzzle.has_input():
+            report.skipped = True
+            return report
+        report.parts = puzzle.run(**(options or {}))
+        report.input_hash = puzzle.input_hash()
+    except Exception:
+        report.error = traceback.format_exc()
+    return report
+
+
+def run_all(
+        modules: List[str],
+        jobs: Optional[int] = None,
+        options: Optional[Dict] = None,
+        src_dir: Path = SRC_DIR,
+        previous: Optional[List[DayReport]] = None) -> List[DayReport]:
+    """
+    Run all puzzle modules in a process pool (one worker per core by default).
+
+    Days that were slowest in `previous` are started first, so they do not
+    end up as the tail of the run.
+    """
+    if previous:
+        durations = {report.module: report.wall_time for report in previous}
+        modules = sorted(modules, key=lambda m: -durations.get(m, float("inf")))
+
+    reports = []
+    with ProcessPoolExecutor(
+            max_workers=jobs or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(str(src_dir),)) as executor:
+        futures = [
+            executor.submit(run_puzzle, module, options) for module in modules
+        ]
+        for future in as_completed(futures):
+            report = future.result()
+            reports.append(report)
+            print(_summary(report), file=sys.stderr)
+
+    reports.sort(key=lambda r: int(r.module[3:]))
+    return reports
+
+
+def write_json(reports: List[DayReport], path: Path) -> None:
+    path.write_text(
+        json.dumps([asdict(report) for report in reports], indent=2),
+        encoding="utf-8")
+
+
+def read_json(path: Path) -> List[DayReport]:
+    return [
+        DayReport(
+            module=entry["module"],
+            day=entry["day"],
+            parts=[read_part(part) for part in entry["parts"]],
+            error=entry["error"],
+            input_hash=entry.get("input_hash"),
+            skipped=entry.get("skipped", False))
+        for entry in json.loads(path.read_text(encoding="utf-8"))
+    ]
+
+
+def write_csv(reports: List[DayReport], path: Path) -> None:
+    with path.open("w", newline="", encoding="utf-8") as fp:
+        writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for report in reports:
+            if report.error:
+                writer.writerow({
+                    "module": report.module,
+                    "day": report.day,
+                    "error": report.error.strip().splitlines()[-1]})
+            for part in report.parts:
+                row = {
+                    "module": report.module,
+                    "day": report.day,
+                    "part": part.part,
+                    "solution": part.solution,
+                    "wall_time": part.wall_time,
+                    "cpu_time": part.cpu_time,
+                    "cached": part.cached,
+                    "error": part.error}
+                if part.stats:
+                    row.update(asdict(part.stats))
+                if part.memory:
+                    row.update(asdict(part.memory))
+                if part.metrics:
+                    row["metrics"] = str(part.metrics)
+                writer.writerow(row)
+
+
+def read_part(entry: Dict) -> PartResult:
+    part = PartResult(**entry)
+    if part.stats:
+        part.stats = Stats(**part.stats)
+    if part.memory:
+        part.memory = MemoryUsage(**part.memory)
+    if part.metrics:
+        part.metrics = Metrics(
+            counters=part.metrics["counters"],
+            # JSON object keys are strings
+            histograms={
+                name: {int(value): n for value, n in histogram.items()}
+                for name, histogram in part.metrics["histograms"].items()
+            })
+    return part
+
+
+def _init_worker(src_dir: str) -> None:
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+
+def _summary(report: DayReport) -> str:
+    if report.error:
+        return f"{report.module}: FAILED ({report.error.strip().splitlines()[-1]})"
+    if report.skipped:
+        return f"{report.module}: skipped (no input)"
+    return f"{report.module}: " + ", ".join(
+        f"part {part.part} FAILED ({part.error.splitlines()[-1]})"
+        if part.error else f"part {part.part} {part.wall_time:.3f}s"
+        for part in report.parts
+        if part.part != PARSE)
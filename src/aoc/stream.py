@@ -0,0 +1,121 @@
+import mmap
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+INT_TOKEN = re.compile(rb"-?\d+")
+NON_INT_BYTE = re.compile(rb"[^-0-9]")
+
+CHUNK_SIZE = 1 << 20
+
+
+class InputStream:
+    """
+    Lazy, single-pass view on a puzzle input.
+
+    Files are memory-mapped, so even inputs larger than the available memory
+    can be consumed line by line. Each call to `lines`, `rows` or `ints`
+    starts a new pass.
+    """
+
+    def __init__(self, path: Optional[Path] = None, data: Optional[bytes] = None):
+        if (path is None) == (data is None):
+            raise ValueError("either path or data is required")
+        self.path = path
+        self.data = data
+
+    @classmethod
+    def from_path(cls, path: Path) -> "InputStream":
+        return cls(path=path)
+
+    @classmethod
+    def from_text(cls, text: str) -> "InputStream":
+        return cls(data=text.encode("utf-8"))
+
+    def rows(self) -> Iterator[bytes]:
+        """
+        Lines as bytes without line terminator. Trailing empty lines are
+        skipped like in the text input.
+        """
+        with self._buffer() as buffer:
+            size = len(buffer)
+            while size and buffer[size - 1:size] in (b"\n", b"\r"):
+                size -= 1
+
+            start = 0
+            while start < size:
+                end = buffer.find(b"\n", start, size)
+                if end < 0:
+                    end = size
+                yield buffer[start:end].rstrip(b"\r")
+                start = end + 1
+
+    def lines(self) -> Iterator[str]:
+        for row in self.rows():
+            yield row.decode("utf-8")
+
+    def ints(self) -> Iterator[int]:
+        """
+        All integers in the input, whatever separates them. Works on inputs
+        that consist of a single huge line.
+        """
+        with self._buffer() as buffer:
+            size = len(buffer)
+            start = 0
+            while start < size:
+                end = min(start + CHUNK_SIZE, size)
+                chunk = buffer[start:end]
+                # do not cut a number in two
+                if end < size:
+                    cut = len(chunk) - len(chunk.rstrip(b"-0123456789"))
+                    if cut < len(chunk):
+                        chunk = chunk[:len(chunk) - cut]
+                        end -= cut
+                    else:
+                        # a number longer than the chunk
+                        match = NON_INT_BYTE.search(buffer, end)
+                        end = match.start() if match else size
+                        chunk = buffer[start:end]
+
+                for token in INT_TOKEN.findall(chunk):
+                    yield int(token)
+                start = end
+
+    def spans(self, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+        """
+        `(start, end)` byte offsets of consecutive chunks of about
+        `chunk_size` bytes that end after a newline (or at the end).
+        """
+        spans = []
+        with self._buffer() as buffer:
+            size = len(buffer)
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    newline = buffer.find(b"\n", end - 1)
+                    end = size if newline < 0 else newline + 1
+                spans.append((start, end))
+                start = end
+        return spans
+
+    def read(self, start: int, end: int) -> bytes:
+        with self._buffer() as buffer:
+            return bytes(buffer[start:end])
+
+    @contextmanager
+    def _buffer(self) -> Iterator[Buffer]:
+        if self.data is not None:
+            yield self.data
+            return
+
+        with self.path.open("rb") as fp:
+            if fp.seek(0, 2) == 0:
+                yield b""
+                return
+
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
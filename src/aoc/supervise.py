@@ -0,0 +1,112 @@
+import multiprocessing
+import os
+import resource
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BudgetExceeded(RuntimeError):
+    pass
+
+
+def call_supervised(
+        fn: Callable[[], T],
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None) -> T:
+    """
+    Call `fn` in a forked child process and return its result.
+
+    The child is killed when it runs longer than `timeout` seconds, and it
+    cannot allocate more than `memory_limit_mb` MB on top of what it
+    inherited. Both raise `BudgetExceeded`, other exceptions in the child
+    are re-raised as `RuntimeError` with the child's traceback.
+    """
+    return Supervised(fn, memory_limit_mb).result(timeout)
+
+
+class Supervised(Generic[T]):
+    """
+    `fn` running in a forked child process, see `call_supervised`.
+
+    `fn` and everything it references are inherited, not pickled; only the
+    result is sent back.
+    """
+
+    def __init__(self, fn: Callable[[], T], memory_limit_mb: Optional[int] = None):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("supervised solving needs the fork start method")
+
+        self.memory_limit_mb = memory_limit_mb
+        context = multiprocessing.get_context("fork")
+        self._receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_child, args=(sender, fn, memory_limit_mb), daemon=True)
+
+        self.start = time.perf_counter()
+        self._process.start()
+        sender.close()
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        """
+        Wait until `timeout` seconds after the start for the result.
+        """
+        if timeout is not None:
+            timeout = max(0.0, self.start + timeout - time.perf_counter())
+        try:
+            if not self._receiver.poll(timeout):
+                raise BudgetExceeded(
+                    f"timed out at {time.perf_counter() - self.start:.1f}s")
+            try:
+                status, value = self._receiver.recv()
+            except EOFError:
+                self._process.join()
+                raise RuntimeError(
+                    f"solver process died with exit code "
+                    f"{self._process.exitcode}")
+        finally:
+            self._receiver.close()
+            _stop(self._process)
+
+        if status == "ok":
+            return value
+        if status == "memory":
+            raise BudgetExceeded(f"exceeded {self.memory_limit_mb} MB")
+        raise RuntimeError(value)
+
+
+def _child(
+        conn: Connection,
+        fn: Callable[[], T],
+        memory_limit_mb: Optional[int]) -> None:
+    try:
+        if memory_limit_mb is not None:
+            _limit_memory(memory_limit_mb)
+        result = fn()
+    except MemoryError:
+        conn.send(("memory", None))
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+    else:
+        conn.send(("ok", result))
+    finally:
+        conn.close()
+
+
+def _limit_memory(memory_limit_mb: int) -> None:
+    with open("/proc/self/statm", "rb") as fp:
+        size = int(fp.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    limit = size + memory_limit_mb * 2**20
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _stop(process: multiprocessing.Process) -> None:
+    if process.is_alive():
+        process.terminate()
+        process.join(1)
+    if process.is_alive():
+        process.kill()
+    process.join()
@@ -0,0 +1,63 @@
+import math
+from dataclasses import dataclass
+from random import Random
+from typing import Dict, List, Type
+
+from aoc import Puzzle
+from aoc.bench import BenchmarkOptions, measure
+
+
+@dataclass
+class SweepPoint:
+    scale: int
+    size: int
+    part: int
+    wall_time: float
+
+
+def sweep(
+        puzzle_cls: Type[Puzzle],
+        scales: List[int],
+        repeat: int = 3,
+        seed: int = 0) -> List[SweepPoint]:
+    """
+    Best-of-`repeat` time of each part on generated inputs of every scale.
+
+    Each call gets a new puzzle instance so parsing is always included.
+    """
+    # the warmup also keeps lazy imports out of the first measurement
+    options = BenchmarkOptions(warmup=1, repeat=repeat)
+    points = []
+    for scale in scales:
+        inp = puzzle_cls().generate(scale, Random(seed))
+        for part in puzzle_cls.parts():
+            _, stats, _ = measure(
+                lambda: getattr(puzzle_cls(), f"solve_part{part}")(inp),
+                options)
+            points.append(SweepPoint(
+                scale=scale, size=len(inp), part=part, wall_time=stats.min))
+    return points
+
+
+def fit_exponent(points: List[SweepPoint], by: str = "size") -> float:
+    """
+    Least-squares slope of log(time) over log(`by`): the `k` in `O(n^k)`
+    with `n` as input bytes (`size`) or generator `scale`.
+    """
+    xs = [math.log(getattr(point, by)) for point in points]
+    ys = [math.log(max(point.wall_time, 1e-9)) for point in points]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if variance == 0:
+        return float("nan")
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance
+
+
+def exponents(points: List[SweepPoint], by: str = "size") -> Dict[int, float]:
+    parts = sorted({point.part for point in points})
+    return {
+        part: fit_exponent(
+            [point for point in points if point.part == part], by)
+        for part in parts
+    }
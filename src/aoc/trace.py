@@ -0,0 +1,70 @@
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+_NO_SPAN = nullcontext()
+
+_active: Optional["Tracer"] = None
+
+
+def span(name: str, **args: Any) -> ContextManager[None]:
+    """
+    Time the `with` block as span `name` with `args` as details. Does
+    nothing outside of a `Tracer`.
+    """
+    if _active is None:
+        return _NO_SPAN
+    return _active.span(name, args)
+
+
+class Tracer:
+    """
+    Records the spans opened within a `with` block as Chrome trace events,
+    viewable in chrome://tracing or Perfetto.
+
+    Spans in forked child processes are not recorded.
+    """
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self._outer: Optional[Tracer] = None
+
+    def __enter__(self) -> "Tracer":
+        global _active
+
+        self._outer = _active
+        _active = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active
+
+        _active = self._outer
+
+    @contextmanager
+    def span(self, name: str, args: Dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append({
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def write(self, path: Path) -> None:
+        import json
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}),
+            encoding="utf-8")
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Type
+
+from aoc import Puzzle, _plain
+from aoc.bench import BenchmarkOptions, measure
+from aoc.inputs import cache_dir, write_atomic
+
+
+@dataclass
+class VariantTiming:
+    part: int
+    variant: str
+    # input size in bytes
+    size: int
+    wall_time: float
+    solution: Any
+
+
+def compare(
+        puzzle_cls: Type[Puzzle],
+        inputs: List[str],
+        repeat: int = 3) -> List[VariantTiming]:
+    """
+    Best-of-`repeat` time of every variant of every part on each input.
+
+    Raises `AssertionError` when the variants of a part disagree.
+    """
+    options = BenchmarkOptions(warmup=1, repeat=repeat)
+    timings = []
+    for inp in inputs:
+        for part in puzzle_cls.parts():
+            answers = {}
+            for variant in puzzle_cls.variants(part):
+                # a new instance per call, so parsing is always included
+                solution, stats, _ = measure(
+                    lambda: puzzle_cls()._variant_solver(part, variant)(inp),
+                    options)
+                answers[variant] = _plain(solution)
+                timings.append(VariantTiming(
+                    part=part,
+                    variant=variant,
+                    size=len(inp),
+                    wall_time=stats.min,
+                    solution=answers[variant]))
+
+            if len(set(map(repr, answers.values()))) > 1:
+                raise AssertionError(
+                    f"part {part} variants disagree on an input of "
+                    f"{len(inp)} bytes: {answers}")
+    return timings
+
+
+def profile_path(puzzle_cls: Type[Puzzle]) -> Path:
+    # measurements of older versions of the source do not apply
+    digest = hashlib.sha256(puzzle_cls()._source()).hexdigest()
+    return cache_dir() / "variants" / f"day{puzzle_cls.day()}-{digest[:16]}.json"
+
+
+def save_profile(puzzle_cls: Type[Puzzle], timings: List[VariantTiming]) -> None:
+    write_atomic(
+        profile_path(puzzle_cls),
+        json.dumps([asdict(timing) for timing in timings]).encode("utf-8"))
+
+
+def fastest(puzzle_cls: Type[Puzzle], part: int, size: int) -> Optional[str]:
+    """
+    Fastest variant of `part` on the measured input closest in size to
+    `size`, None without measurements of the current source.
+    """
+    try:
+        entries = json.loads(profile_path(puzzle_cls).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    entries = [entry for entry in entries if entry["part"] == part]
+    if not entries:
+        return None
+
+    closest = min(
+        {entry["size"] for entry in entries},
+        key=lambda measured: abs(math.log(max(measured, 1) / max(size, 1))))
+    return min(
+        (entry for entry in entries if entry["size"] == closest),
+        key=lambda entry: entry["wall_time"])["variant"]
@@ -1,12 +1,4 @@
-import operator
-from dataclasses import dataclass
-from functools import reduce
-from operator import itemgetter
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Optional, Set, Union
-
-import numpy as np
-import numpy.ma as ma
+from typing import List, Optional, Union
 
 import aoc
 
@@ -57,7 +49,7 @@ class Puzzle(aoc.Puzzle):
         return 0
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        lines = self.parse_input(inp)
+        lines = self.parsed(inp, mutable=False)
         return sum(
             self.syntax_error_score(line)
             for line in lines
@@ -93,7 +85,7 @@ class Puzzle(aoc.Puzzle):
         return acc
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        lines = self.parse_input(inp)
+        lines = self.parsed(inp, mutable=False)
 
         list = [
             self.autocomplete_score(line)
@@ -105,6 +97,22 @@ class Puzzle(aoc.Puzzle):
         list.sort()
         return list[len(list) // 2]
 
+    def solve_part1_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        return sum(
+            self.syntax_error_score(line)
+            for line in inp.lines()
+        )
+
+    def solve_part2_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        # only the scores of incomplete lines are kept
+        list = [
+            score
+            for score in map(self.autocomplete_score, inp.lines())
+            if score is not None
+        ]
+        list.sort()
+        return list[len(list) // 2]
+
 
 if __name__ == '__main__':
     Puzzle().solve()
@@ -1,14 +1,12 @@
-import operator
-from dataclasses import dataclass
-from functools import reduce
-from operator import itemgetter
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Optional, Set, Union
+from __future__ import annotations
 
-import numpy as np
-import numpy.ma as ma
+from dataclasses import dataclass
+from typing import Union
 
 import aoc
+from aoc import grid, metrics
+
+np = aoc.lazy_import("numpy")
 
 
 @dataclass
@@ -32,6 +30,7 @@ def simulate_step(map: np.ndarray) -> int:
     map += 1
 
     flashed = np.zeros(shape=map.shape, dtype=bool)
+    waves = 0
     while True:
         flashing = map > 9
         todo = np.where(flashing & ~flashed)
@@ -39,6 +38,7 @@ def simulate_step(map: np.ndarray) -> int:
             break
 
         flashed = flashing
+        waves += 1
 
         for (y, x) in zip(*todo):
             top = clamp(0, y - 1, 9)
@@ -49,6 +49,7 @@ def simulate_step(map: np.ndarray) -> int:
 
     flashes = flashed.sum()
     map[flashed] = 0
+    metrics.observe("flash_waves", waves)
     return flashes
 
 
@@ -67,12 +68,14 @@ class Puzzle(aoc.Puzzle):
         5283751526"""
     EXAMPLE_SOLUTION_PART1 = 1656
     EXAMPLE_SOLUTION_PART2 = 195
+    SHARE_PARSED = True
+    PERSIST = True
 
     def parse_input(self, inp: str) -> np.ndarray:
-        return np.array([list(map(int, line)) for line in inp.split("\n")])
+        return grid.digit_grid(inp)
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        map = self.parse_input(inp)
+        map = self.parsed(inp)
 
         flashes = 0
         for i in range(100):
@@ -81,7 +84,7 @@ class Puzzle(aoc.Puzzle):
         return flashes
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        map = self.parse_input(inp)
+        map = self.parsed(inp)
 
         for i in range(10000):
             if simulate_step(map) == 100:
@@ -1,15 +1,8 @@
-import operator
 from collections import defaultdict
-from dataclasses import dataclass
-from functools import reduce
-from operator import itemgetter
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
-
-import numpy as np
-import numpy.ma as ma
+from typing import Dict, List, Tuple, Union
 
 import aoc
+from aoc import metrics
 
 
 def build_graph(edges: List[Tuple[str, str]]) -> Dict[str, List[str]]:
@@ -29,22 +22,27 @@ class Solver1:
     def all_paths(self) -> List[List[str]]:
         self.stack = []
         self.solutions = []
-        self._all_paths(node="start")
+        calls = self._all_paths(node="start")
+        metrics.count("dfs_calls", calls)
         return self.solutions
 
-    def _all_paths(self, node: str):
+    def _all_paths(self, node: str) -> int:
+        # returns the number of calls, counted in a local variable
         if node == "end":
             # print(",".join(stack))
             self.solutions.append(self.stack[:])
-            return
+            return 1
+
+        calls = 1
 
         for edge in self.graph[node]:
             if edge.islower() and edge in self.stack:
                 continue
 
             self.stack.append(node)
-            self._all_paths(edge)
+            calls += self._all_paths(edge)
             self.stack.pop()
+        return calls
 
 
 class Solver2:
@@ -56,14 +54,17 @@ class Solver2:
     def all_paths(self) -> List[List[str]]:
         self.stack = []
         self.solutions = []
-        self._all_paths(node="start", yssc=False)
+        calls = self._all_paths(node="start", yssc=False)
+        metrics.count("dfs_calls", calls)
         return self.solutions
 
-    def _all_paths(self, node: str, yssc: bool):
+    def _all_paths(self, node: str, yssc: bool) -> int:
         if node == "end":
             # print(",".join(stack))
             self.solutions.append(self.stack[:])
-            return
+            return 1
+
+        calls = 1
 
         for edge in self.graph[node]:
             if edge == "start":
@@ -76,8 +77,9 @@ class Solver2:
                     next_yssc = True
 
             self.stack.append(node)
-            self._all_paths(edge, next_yssc)
+            calls += self._all_paths(edge, next_yssc)
             self.stack.pop()
+        return calls
 
 
 class Puzzle(aoc.Puzzle):
@@ -98,12 +100,12 @@ class Puzzle(aoc.Puzzle):
         return [tuple(line.split("-", 1)) for line in inp.split("\n")]
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        edges = self.parse_input(inp)
+        edges = self.parsed(inp, mutable=False)
         graph = build_graph(edges)
         return len(Solver1(graph).all_paths())
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        edges = self.parse_input(inp)
+        edges = self.parsed(inp, mutable=False)
         graph = build_graph(edges)
         return len(Solver2(graph).all_paths())
 
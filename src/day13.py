@@ -1,17 +1,13 @@
-import operator
+from __future__ import annotations
+
 import re
-from collections import defaultdict
 from dataclasses import dataclass
-from functools import reduce
-from operator import itemgetter
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
-
-import numpy as np
-import numpy.ma as ma
+from typing import List, Tuple, Union
 
 import aoc
 
+np = aoc.lazy_import("numpy")
+
 
 @dataclass
 class Input:
@@ -75,6 +71,7 @@ class Puzzle(aoc.Puzzle):
         """
     EXAMPLE_SOLUTION_PART1 = 17
     EXAMPLE_SOLUTION_PART2 = 16
+    PERSIST = True
 
     def parse_input(self, inp: str) -> Input:
 
@@ -97,12 +94,12 @@ class Puzzle(aoc.Puzzle):
         )
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        input = self.parse_input(inp)
+        input = self.parsed(inp)
         res = fold(input.dots, input.folds[0][0], input.folds[0][1])
         return int(np.sum(res))
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        input = self.parse_input(inp)
+        input = self.parsed(inp)
 
         res = input.dots
         for infold in input.folds:
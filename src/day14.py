@@ -1,14 +1,5 @@
-import operator
-import re
-from collections import Counter, defaultdict
-from dataclasses import dataclass
-from functools import reduce
-from operator import itemgetter
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
-
-import numpy as np
-import numpy.ma as ma
+from collections import Counter
+from typing import Dict, Tuple, Union
 
 import aoc
 
@@ -34,6 +25,8 @@ class Solver:
         self.state = clone
 
     def print(self):
+        from pprint import pprint
+
         print("======")
         pprint(self.state)
 
@@ -82,7 +75,7 @@ class Puzzle(aoc.Puzzle):
         return template, inserts
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        solver = Solver(*self.parse_input(inp))
+        solver = Solver(*self.parsed(inp, mutable=False))
 
         for i in range(10):
             solver.step()
@@ -92,7 +85,7 @@ class Puzzle(aoc.Puzzle):
         return c[-1][1] - c[0][1]
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        solver = Solver(*self.parse_input(inp))
+        solver = Solver(*self.parsed(inp, mutable=False))
 
         for i in range(40):
             solver.step()
@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 from heapq import heappop, heappush
-from typing import Optional, Tuple, Union
+from random import Random
+from typing import Callable, Optional, Tuple, Union
 
 import attr
-import numpy as np
 
 import aoc
+from aoc import grid, metrics, trace
+
+np = aoc.lazy_import("numpy")
 
 
 @attr.dataclass(slots=True)
@@ -35,7 +40,8 @@ def shortest_path(map: np.ndarray, start: Pos, end: Pos) -> Optional[int]:
     heap = []
     dist[start.y, start.x] = 0
     heappush(heap, State(0, start))
-    nodes = 0
+    pops = 0
+    stale = 0
 
     def push(edge_cost: int, pos: Pos):
         ncost = edge_cost + map[pos.y, pos.x]
@@ -44,15 +50,17 @@ def shortest_path(map: np.ndarray, start: Pos, end: Pos) -> Optional[int]:
             dist[pos.y, pos.x] = ncost
 
     while heap:
-        nodes += 1
+        pops += 1
         state = heappop(heap)
         cost = state.cost
         position = state.pos
 
         if position == end:
+            _count_heap(pops, stale, len(heap))
             return cost
 
         if cost > dist[position.y, position.x]:
+            stale += 1
             continue
 
         if position.y < h - 1:
@@ -64,6 +72,7 @@ def shortest_path(map: np.ndarray, start: Pos, end: Pos) -> Optional[int]:
         if position.x > 0:
             push(cost, Pos(position.x - 1, position.y))
 
+    _count_heap(pops, stale, len(heap))
     return None
 
 
@@ -75,6 +84,8 @@ def shortest_path_opt(map: np.ndarray, start: Pos, end: Pos) -> Optional[int]:
     heappush(heap, StateOpt(0, 0, (start.y, start.x)))
 
     e = (end.y, end.x)
+    pops = 0
+    stale = 0
 
     def push(edge_cost: int, pos: Tuple[int, int]):
         ncost = edge_cost + map[pos]
@@ -83,14 +94,17 @@ def shortest_path_opt(map: np.ndarray, start: Pos, end: Pos) -> Optional[int]:
             heappush(heap, StateOpt(ncost, ncost, pos))
 
     while heap:
+        pops += 1
         state = heappop(heap)
         cost = state.cost
         position = state.pos
 
         if position == e:
+            _count_heap(pops, stale, len(heap))
             return cost
 
         if cost > dist[position]:
+            stale += 1
             continue
 
         pos_y = position[0]
@@ -105,11 +119,28 @@ def shortest_path_opt(map: np.ndarray, start: Pos, end: Pos) -> Optional[int]:
         if pos_x > 0:
             push(cost, (pos_y, pos_x - 1))
 
+    _count_heap(pops, stale, len(heap))
     return None
 
 
+def _count_heap(pops: int, stale: int, remaining: int) -> None:
+    # every push is either popped or still in the heap
+    metrics.count("heap_pushes", pops + remaining)
+    metrics.count("heap_pops", pops)
+    metrics.count("stale_pops", stale)
+
+
+def lowest_risk(
+        map: np.ndarray,
+        engine: Callable[[np.ndarray, Pos, Pos], Optional[int]]) -> Optional[int]:
+    with trace.span("dijkstra", engine=engine.__name__):
+        return engine(map, Pos(0, 0), Pos(map.shape[0] - 1, map.shape[1] - 1))
+
+
 class Puzzle(aoc.Puzzle):
     DAY = 15
+    # attrs is needed eagerly for the class decorators
+    IMPORT_BUDGET_MS = 75
     EXAMPLE = """
         1163751742
         1381373672
@@ -124,30 +155,43 @@ class Puzzle(aoc.Puzzle):
         """
     EXAMPLE_SOLUTION_PART1 = 40
     EXAMPLE_SOLUTION_PART2 = 315
+    SHARE_PARSED = True
+    PERSIST = True
+    SWEEP_SCALES = [10, 20, 40]
 
     def parse_input(self, inp: str) -> np.ndarray:
-        return np.array([
-            [int(x) for x in row]
-            for row in inp.split("\n")
-        ], dtype=np.int16)
+        # path costs are accumulated in the map's dtype
+        return grid.digit_grid(inp, dtype="int16")
 
-    def solve_part1(self, inp: str) -> Union[int, str, float]:
-        map = self.parse_input(inp)
-        return shortest_path_opt(
-            map, Pos(0, 0), Pos(map.shape[0] - 1, map.shape[1] - 1))
+    def generate(self, scale: int, rng: Random) -> str:
+        return "\n".join(
+            "".join(str(rng.randint(1, 9)) for _ in range(scale))
+            for _ in range(scale)
+        )
 
-    def solve_part2(self, inp: str) -> Union[int, str, float]:
-        map = self.parse_input(inp)
+    def solve_part1(self, inp: str) -> Union[int, str, float]:
+        return lowest_risk(self.parsed(inp, mutable=False), shortest_path_opt)
 
-        bigmap = np.block([
-            [map + (i + j) for j in range(5)]
-            for i in range(5)
-        ])
-        bigmap %= 9
-        bigmap[bigmap == 0] = 9
+    def solve_part1_simple(self, inp: str) -> Union[int, str, float]:
+        return lowest_risk(self.parsed(inp, mutable=False), shortest_path)
 
-        return shortest_path_opt(
-            bigmap, Pos(0, 0), Pos(bigmap.shape[0] - 1, bigmap.shape[1] - 1))
+    def solve_part2(self, inp: str) -> Union[int, str, float]:
+        return lowest_risk(self.full_map(inp), shortest_path_opt)
+
+    def solve_part2_simple(self, inp: str) -> Union[int, str, float]:
+        return lowest_risk(self.full_map(inp), shortest_path)
+
+    def full_map(self, inp: str) -> np.ndarray:
+        map = self.parsed(inp, mutable=False)
+
+        with trace.span("build map"):
+            bigmap = np.block([
+                [map + (i + j) for j in range(5)]
+                for i in range(5)
+            ])
+            bigmap %= 9
+            bigmap[bigmap == 0] = 9
+        return bigmap
 
 
 if __name__ == '__main__':
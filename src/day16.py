@@ -1,13 +1,10 @@
 import binascii
 from dataclasses import dataclass
 from functools import reduce
-from heapq import heappop, heappush
 from io import StringIO
 from operator import __mul__, methodcaller
-from typing import List, Optional, Tuple, Union
-
-import attr
-import numpy as np
+from random import Random
+from typing import List, Union
 
 import aoc
 
@@ -95,6 +92,47 @@ def parse_pkg(b: StringIO) -> Package:
             return Operator(version=version, type=type, pkgs=pkgs)
 
 
+def encode_pkg(pkg: Package) -> str:
+    """
+    Inverse of `parse_pkg`.
+    """
+    header = f"{pkg.version:03b}"
+    if isinstance(pkg, Literal):
+        value = f"{pkg.value:b}"
+        value = value.zfill(-(-len(value) // 4) * 4)
+        groups = [value[i:i + 4] for i in range(0, len(value), 4)]
+        return header + "100" + "".join(
+            ("1" if i < len(groups) - 1 else "0") + group
+            for i, group in enumerate(groups)
+        )
+
+    body = "".join(encode_pkg(sub) for sub in pkg.pkgs)
+    if len(body) < 1 << 15:
+        return f"{header}{pkg.type:03b}0{len(body):015b}{body}"
+    return f"{header}{pkg.type:03b}1{len(pkg.pkgs):011b}{body}"
+
+
+def random_pkg(rng: Random, literals: int) -> Package:
+    """
+    Random package tree with `literals` literal packages.
+    """
+    version = rng.randint(0, 7)
+    if literals == 1:
+        return Literal(version=version, value=rng.randint(0, 255))
+
+    if rng.random() < 0.2:
+        type = rng.choice([5, 6, 7])
+        count = 2
+    else:
+        type = rng.choice([0, 1, 2, 3])
+        count = rng.randint(2, min(literals, 5, 2047))
+
+    cuts = [0] + sorted(rng.sample(range(1, literals), count - 1)) + [literals]
+    return Operator(version=version, type=type, pkgs=[
+        random_pkg(rng, end - start) for start, end in zip(cuts, cuts[1:])
+    ])
+
+
 class Puzzle(aoc.Puzzle):
     EXAMPLES = [
         ("8A004A801A8002F478", 16, None),
@@ -110,17 +148,23 @@ class Puzzle(aoc.Puzzle):
         ("9C005AC2F8F0", None, 0),
         ("9C0141080250320F1802104A08", None, 1),
     ]
+    SWEEP_SCALES = [100, 200, 400, 800, 1600]
 
     def parse_input(self, inp: str) -> str:
         return "".join([f"{i:08b}" for i in binascii.a2b_hex(inp)])
 
+    def generate(self, scale: int, rng: Random) -> str:
+        bits = encode_pkg(random_pkg(rng, scale))
+        bits += "0" * (-len(bits) % 8)
+        return f"{int(bits, 2):0{len(bits) // 4}X}"
+
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        b = self.parse_input(inp)
+        b = self.parsed(inp, mutable=False)
         pkg = parse_pkg(StringIO(b))
         return pkg.sum_versions()
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        b = self.parse_input(inp)
+        b = self.parsed(inp, mutable=False)
         pkg = parse_pkg(StringIO(b))
         return pkg.eval()
 
@@ -1,5 +1,4 @@
 import re
-import textwrap
 from dataclasses import dataclass
 from itertools import product
 from typing import Optional, Union
@@ -46,7 +45,7 @@ class Puzzle(aoc.Puzzle):
         return Target(int(x0), int(x1), int(y0), int(y1))
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        target = self.parse_input(inp)
+        target = self.parsed(inp, mutable=False)
 
         res = 0
         n = max(abs(target.y0), target.x1) + 1
@@ -58,7 +57,7 @@ class Puzzle(aoc.Puzzle):
         return res
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        target = self.parse_input(inp)
+        target = self.parsed(inp, mutable=False)
 
         res = set()
         n = max(abs(target.y0), target.x1) + 1
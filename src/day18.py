@@ -3,9 +3,11 @@ from copy import deepcopy
 from dataclasses import dataclass
 from functools import reduce as fnreduce
 from itertools import permutations
+from random import Random
 from typing import Generic, List, Optional, TypeVar, Union
 
 import aoc
+from aoc import metrics
 
 NoneType = type(None)
 
@@ -195,12 +197,32 @@ def reduce(data: BaseNode) -> BaseNode:
 
             return False
 
-    while ReduceVisitor().visit(data) or SplitVisitor().visit(data):
-        pass
+    explodes = 0
+    splits = 0
+    while True:
+        if ReduceVisitor().visit(data):
+            explodes += 1
+        elif SplitVisitor().visit(data):
+            splits += 1
+        else:
+            break
 
+    metrics.count("explodes", explodes)
+    metrics.count("splits", splits)
+    # every explode or split starts over from the root
+    metrics.count("reduce_restarts", explodes + splits)
     return data
 
 
+def random_number(rng: Random, depth: int = 0):
+    """
+    Random reduced snailfish number as nested lists.
+    """
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return rng.randint(0, 9)
+    return [random_number(rng, depth + 1), random_number(rng, depth + 1)]
+
+
 class Puzzle(aoc.Puzzle):
     EXAMPLE = """
         [[[0,[5,8]],[[1,7],[9,6]]],[[4,[1,2]],[[1,4],2]]]
@@ -216,12 +238,19 @@ class Puzzle(aoc.Puzzle):
     """
     EXAMPLE_SOLUTION_PART1 = 4140
     EXAMPLE_SOLUTION_PART2 = 3993
+    SWEEP_SCALES = [10, 20, 40, 80]
 
     def parse_input(self, inp: str) -> List[BaseNode]:
         return [create_tree(ast.literal_eval(line)) for line in inp.splitlines()]
 
+    def generate(self, scale: int, rng: Random) -> str:
+        return "\n".join(
+            str(random_number(rng)).replace(" ", "")
+            for _ in range(scale)
+        )
+
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        lines = self.parse_input(inp)
+        lines = self.parsed(inp)
 
         def add(acc: BaseNode, right: BaseNode) -> BaseNode:
             return reduce(Node(acc, right))
@@ -230,7 +259,7 @@ class Puzzle(aoc.Puzzle):
         return data.magnitude()
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        lines = self.parse_input(inp)
+        lines = self.parsed(inp, mutable=False)
 
         def magnitude(left: BaseNode, right: BaseNode) -> int:
             return reduce(Node(deepcopy(left), deepcopy(right))).magnitude()
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Union
+from random import Random
+from typing import Iterable, Iterator, List, Union
 
 import aoc
 
+np = aoc.lazy_import("numpy")
+
+COMMANDS = ("forward", "down", "up")
+
 
 @dataclass
 class Pos:
@@ -46,9 +53,10 @@ class Up:
 
 
 def parse(lines: str) -> List:
-    lines = lines.split("\n")
+    return list(parse_lines(lines.split("\n")))
 
-    cmds = []
+
+def parse_lines(lines: Iterable[str]) -> Iterator:
     for line in lines:
         if not line:
             continue
@@ -56,15 +64,89 @@ def parse(lines: str) -> List:
         (cmd, value) = line.split(" ", 1)
         value = int(value)
         if cmd == "forward":
-            c = Forward(value)
+            yield Forward(value)
         elif cmd == "down":
-            c = Down(value)
+            yield Down(value)
         elif cmd == "up":
-            c = Up(value)
+            yield Up(value)
         else:
             raise RuntimeError(cmd)
-        cmds.append(c)
-    return cmds
+
+
+@dataclass
+class Commands:
+    # first letter of the command: b"f", b"d" or b"u"
+    op: np.ndarray
+    value: np.ndarray
+
+    def aim_changes(self) -> np.ndarray:
+        return np.where(
+            self.op == ord("d"), self.value,
+            np.where(self.op == ord("u"), -self.value, 0))
+
+
+def parse_columns(inp: Union[str, bytes]) -> Commands:
+    """
+    Commands as columns, without a Python object per line.
+    """
+    if isinstance(inp, str):
+        inp = inp.encode("ascii")
+    data = np.frombuffer(inp, dtype=np.uint8)
+    # "\r\n" ends a line at "\r" followed by an empty one
+    ends = np.append(
+        np.flatnonzero((data == ord("\n")) | (data == ord("\r"))), len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    non_empty = starts < ends
+    starts = starts[non_empty]
+    ends = ends[non_empty]
+    op = data[starts]
+    known = np.isin(op, [ord(cmd[0]) for cmd in COMMANDS])
+    if not known.all():
+        line = int(np.flatnonzero(~known)[0])
+        raise RuntimeError(inp[starts[line]:ends[line]].decode("ascii"))
+
+    # each digit adds digit * 10^(places to the end of its line)
+    digits = np.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+    line = np.searchsorted(ends, digits)
+    places = (ends[line] - digits - 1).astype(np.int64)
+    terms = (data[digits] - ord("0")).astype(np.int64) * 10 ** places
+    first_digits = np.flatnonzero(np.diff(line, prepend=-1))
+    return Commands(op=op, value=np.add.reduceat(terms, first_digits))
+
+
+@dataclass(frozen=True)
+class Summary:
+    """
+    Effect of a sequence of commands on the part 2 state, relative to a
+    start with zero aim: it moves `horizontal` forward, changes the aim by
+    `aim` and goes `depth` deeper plus `horizontal` times the start aim.
+
+    For part 1 `aim` is the depth, as down and up change it directly.
+    """
+    horizontal: int = 0
+    depth: int = 0
+    aim: int = 0
+
+    def then(self, other: Summary) -> Summary:
+        return Summary(
+            horizontal=self.horizontal + other.horizontal,
+            depth=self.depth + other.depth + self.aim * other.horizontal,
+            aim=self.aim + other.aim)
+
+
+def summarize(chunk: bytes) -> Summary:
+    chunk = chunk.strip()
+    if not chunk:
+        return Summary()
+
+    commands = parse_columns(chunk)
+    is_forward = commands.op == ord("f")
+    aim = np.cumsum(commands.aim_changes())
+    forward = commands.value[is_forward]
+    return Summary(
+        horizontal=int(forward.sum()),
+        depth=int(np.dot(aim[is_forward], forward)),
+        aim=int(aim[-1]))
 
 
 class Puzzle(aoc.Puzzle):
@@ -78,21 +160,58 @@ class Puzzle(aoc.Puzzle):
         forward 2"""
     EXAMPLE_SOLUTION_PART1 = 150
     EXAMPLE_SOLUTION_PART2 = 900
+    SWEEP_SCALES = [10_000, 100_000, 1_000_000]
+
+    def parse_input(self, inp: str) -> Commands:
+        return parse_columns(inp)
+
+    def generate(self, scale: int, rng: Random) -> str:
+        # down before up, so the depth stays positive
+        return "\n".join(
+            f"{rng.choice(COMMANDS[:2] if i < scale // 2 else COMMANDS)} "
+            f"{rng.randint(1, 9)}"
+            for i in range(scale))
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
+        commands = self.parsed(inp, mutable=False)
+        forward = commands.value[commands.op == ord("f")].sum()
+        depth = commands.aim_changes().sum()
+        return int(forward) * int(depth)
+
+    def solve_part2(self, inp: str) -> Union[int, str, float]:
+        commands = self.parsed(inp, mutable=False)
+        is_forward = commands.op == ord("f")
+        aim = np.cumsum(commands.aim_changes())
+        forward = commands.value[is_forward]
+        return int(forward.sum()) * int(np.dot(aim[is_forward], forward))
+
+    def solve_part1_objects(self, inp: str) -> Union[int, str, float]:
         pos = Pos()
         x = parse(inp)
         for c in x:
             c.apply1(pos)
         return pos.horizontal * pos.depth
 
-    def solve_part2(self, inp: str) -> Union[int, str, float]:
+    def solve_part2_objects(self, inp: str) -> Union[int, str, float]:
         pos = Pos()
         x = parse(inp)
         for c in x:
             c.apply2(pos)
         return pos.horizontal * pos.depth
 
+    def solve_part1_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        summary = self.summarize_stream(inp)
+        return summary.horizontal * summary.aim
+
+    def solve_part2_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        summary = self.summarize_stream(inp)
+        return summary.horizontal * summary.depth
+
+    def summarize_stream(self, inp: aoc.InputStream) -> Summary:
+        from aoc.parallel import reduce_chunks
+
+        return reduce_chunks(inp, summarize, Summary.then, Summary())
+
 
 if __name__ == '__main__':
     Puzzle().solve()
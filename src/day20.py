@@ -1,9 +1,13 @@
-from dataclasses import dataclass
-from typing import List, Union
+from __future__ import annotations
 
-import numpy as np
+from dataclasses import dataclass
+from random import Random
+from typing import Union
 
 import aoc
+from aoc import grid
+
+np = aoc.lazy_import("numpy")
 
 
 @dataclass
@@ -75,18 +79,26 @@ class Puzzle(aoc.Puzzle):
     """
     EXAMPLE_SOLUTION_PART1 = 35
     EXAMPLE_SOLUTION_PART2 = 3351
+    SHARE_PARSED = True
+    PERSIST = True
+    SWEEP_SCALES = [5, 10, 20, 40]
 
     def parse_input(self, inp: str) -> Input:
         top, bottom = inp.split("\n\n")
         return Input(
             arr=np.array([x == "#" for x in top if x in ".#"], dtype=bool),
-            map=np.array([
-                [x == "#" for x in line]
-                for line in bottom.splitlines()
-            ], dtype=bool))
+            map=grid.char_grid(bottom))
+
+    def generate(self, scale: int, rng: Random) -> str:
+        algorithm = "".join(rng.choice(".#") for _ in range(512))
+        image = "\n".join(
+            "".join(rng.choice(".#") for _ in range(scale))
+            for _ in range(scale)
+        )
+        return algorithm + "\n\n" + image
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        input = self.parse_input(inp)
+        input = self.parsed(inp, mutable=False)
         map = input.map
         arr = input.arr
         assert arr.shape == (512,)
@@ -100,7 +112,7 @@ class Puzzle(aoc.Puzzle):
         return np.sum(map)
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        input = self.parse_input(inp)
+        input = self.parsed(inp, mutable=False)
         map = input.map
         arr = input.arr
         assert arr.shape == (512,)
@@ -1,6 +1,62 @@
-from typing import Union
+from __future__ import annotations
+
+from typing import Tuple, Union
 
 import aoc
+from aoc import grid
+
+np = aoc.lazy_import("numpy")
+
+
+def bit_matrix(report: Union[str, bytes]) -> np.ndarray:
+    """
+    One row of booleans per line of the report, most significant bit first.
+    """
+    # no copy without "\r"
+    if isinstance(report, str):
+        report = report.replace("\r", "")
+    else:
+        report = report.replace(b"\r", b"")
+    return grid.char_grid(report, "1")
+
+
+def to_int(bits: np.ndarray) -> int:
+    # Python ints, so any number of bits works
+    return int("".join("1" if bit else "0" for bit in bits) or "0", 2)
+
+
+def gamma_epsilon(ones: np.ndarray, total: int) -> int:
+    gamma = to_int(ones * 2 > total)
+    epsilon = ~gamma & ((1 << len(ones)) - 1)
+    return epsilon * gamma
+
+
+def count_ones(chunk: bytes) -> Tuple[np.ndarray, int]:
+    matrix = bit_matrix(chunk.strip())
+    if not len(matrix):
+        # the initial value of the reduction, whatever the number of bits
+        return 0, 0
+    return np.count_nonzero(matrix, axis=0), len(matrix)
+
+
+def add_counts(
+        a: Tuple[np.ndarray, int],
+        b: Tuple[np.ndarray, int]) -> Tuple[np.ndarray, int]:
+    return a[0] + b[0], a[1] + b[1]
+
+
+def rating(matrix: np.ndarray, most_common: bool) -> int:
+    rows = matrix
+    for column in range(matrix.shape[1]):
+        if len(rows) == 1:
+            break
+        ones = rows[:, column]
+        # ties keep the ones for the most common value
+        keep_ones = (2 * np.count_nonzero(ones) >= len(rows)) == most_common
+        rows = rows[ones == keep_ones]
+    if len(rows) != 1:
+        raise ValueError("the report has no unique rating")
+    return to_int(rows[0])
 
 
 class Puzzle(aoc.Puzzle):
@@ -21,7 +77,25 @@ class Puzzle(aoc.Puzzle):
     EXAMPLE_SOLUTION_PART1 = 198
     EXAMPLE_SOLUTION_PART2 = 230
 
+    def parse_input(self, inp: str) -> np.ndarray:
+        return bit_matrix(inp)
+
     def solve_part1(self, inp: str) -> Union[int, str, float]:
+        matrix = self.parsed(inp, mutable=False)
+        return gamma_epsilon(np.count_nonzero(matrix, axis=0), len(matrix))
+
+    def solve_part1_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        from aoc.parallel import reduce_chunks
+
+        ones, total = reduce_chunks(inp, count_ones, add_counts, (0, 0))
+        return gamma_epsilon(ones, total)
+
+    def solve_part2(self, inp: str) -> Union[int, str, float]:
+        matrix = self.parsed(inp, mutable=False)
+        return rating(matrix, most_common=True) \
+            * rating(matrix, most_common=False)
+
+    def solve_part1_loops(self, inp: str) -> Union[int, str, float]:
         numbers = [int(x, 2) for x in inp.split("\n")]
         bits = len(inp.split("\n", 1)[0])
 
@@ -41,7 +115,7 @@ class Puzzle(aoc.Puzzle):
         epsilon = ~gamma & ((1 << bits) - 1)
         return epsilon * gamma
 
-    def solve_part2(self, inp: str) -> Union[int, str, float]:
+    def solve_part2_loops(self, inp: str) -> Union[int, str, float]:
         numbers = [int(x, 2) for x in inp.split("\n")]
         bits = len(inp.split("\n", 1)[0])
 
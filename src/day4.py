@@ -1,12 +1,14 @@
+from __future__ import annotations
+
 import itertools
 from dataclasses import dataclass
-from typing import Iterator, List, Tuple, Union
-
-import numpy as np
-import numpy.ma as ma
+from random import Random
+from typing import List, Tuple, Union
 
 import aoc
 
+np = aoc.lazy_import("numpy")
+
 
 @dataclass
 class BingoBoard:
@@ -32,7 +34,7 @@ class BingoBoard:
         return a or b
 
     def sum_of_unmarked(self) -> int:
-        return int(np.sum(ma.masked_array(self.numbers, mask=self.mask)))
+        return int(np.sum(self.numbers[~self.mask]))
 
 
 class Puzzle(aoc.Puzzle):
@@ -59,6 +61,7 @@ class Puzzle(aoc.Puzzle):
          2  0 12  3  7"""
     EXAMPLE_SOLUTION_PART1 = 4512
     EXAMPLE_SOLUTION_PART2 = 1924
+    SWEEP_SCALES = [100, 200, 400, 800]
 
     def parse_input(self, inp: str) -> Tuple[List[int], List[BingoBoard]]:
         lines = inp.split("\n")
@@ -73,8 +76,22 @@ class Puzzle(aoc.Puzzle):
 
         return numbers, boards
 
+    def generate(self, scale: int, rng: Random) -> str:
+        numbers = list(range(100))
+        rng.shuffle(numbers)
+
+        boards = []
+        for _ in range(scale):
+            cells = rng.sample(range(100), 25)
+            boards.append("\n".join(
+                " ".join(f"{cell:2}" for cell in cells[row * 5:row * 5 + 5])
+                for row in range(5)
+            ))
+
+        return ",".join(map(str, numbers)) + "\n\n" + "\n\n".join(boards)
+
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        numbers, boards = self.parse_input(inp)
+        numbers, boards = self.parsed(inp)
 
         for number in numbers:
             for (i, board) in enumerate(boards):
@@ -85,7 +102,7 @@ class Puzzle(aoc.Puzzle):
                     return number * board.sum_of_unmarked()
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        numbers, boards = self.parse_input(inp)
+        numbers, boards = self.parsed(inp)
 
         for number in numbers:
             for (i, board) in enumerate(boards):
@@ -1,11 +1,13 @@
+from __future__ import annotations
+
 import re
 from dataclasses import dataclass
 from typing import List, Union
 
-import numpy as np
-
 import aoc
 
+np = aoc.lazy_import("numpy")
+
 
 @dataclass
 class Pos:
@@ -98,7 +100,7 @@ class Puzzle(aoc.Puzzle):
         return Size(width + 1, height + 1)
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        lines = self.parse_input(inp)
+        lines = self.parsed(inp, mutable=False)
         map = VentureMap(self.get_board_size(lines))
 
         for line in lines:
@@ -108,7 +110,7 @@ class Puzzle(aoc.Puzzle):
         return int(np.sum(map.map >= 2))
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        lines = self.parse_input(inp)
+        lines = self.parsed(inp, mutable=False)
         map = VentureMap(self.get_board_size(lines))
 
         for line in lines:
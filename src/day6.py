@@ -1,11 +1,7 @@
-import re
 from dataclasses import dataclass
 from functools import lru_cache
-from pprint import pprint
 from typing import List, Union
 
-import numpy as np
-
 import aoc
 
 
@@ -43,7 +39,7 @@ class Puzzle(aoc.Puzzle):
         return [Lanternfish(int(x)) for x in inp.split(",")]
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        fishes = self.parse_input(inp)
+        fishes = self.parsed(inp)
 
         for i in range(80):
             new_fishes = []
@@ -58,7 +54,7 @@ class Puzzle(aoc.Puzzle):
         return len(fishes)
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        it = [fish.internal_timer for fish in self.parse_input(inp)]
+        it = [fish.internal_timer for fish in self.parsed(inp, mutable=False)]
         return calc_list(it, 256)
 
 
@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import List, Union
 
 import aoc
@@ -13,7 +14,7 @@ class Puzzle(aoc.Puzzle):
         return [int(x) for x in inp.split(",")]
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        poses = self.parse_input(inp)
+        poses = self.parsed(inp, mutable=False)
         min_pos = min(poses)
         max_pos = max(poses)
 
@@ -23,7 +24,7 @@ class Puzzle(aoc.Puzzle):
         ])
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        poses = self.parse_input(inp)
+        poses = self.parsed(inp, mutable=False)
         min_pos = min(poses)
         max_pos = max(poses)
 
@@ -32,6 +33,24 @@ class Puzzle(aoc.Puzzle):
             for x in range(min_pos, max_pos + 1)
         ])
 
+    def solve_part1_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        # only the number of crabs per position is kept
+        poses = Counter(inp.ints())
+        return min([
+            sum([count * abs(pos - x) for pos, count in poses.items()])
+            for x in range(min(poses), max(poses) + 1)
+        ])
+
+    def solve_part2_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        poses = Counter(inp.ints())
+        return min([
+            sum([
+                count * abs(pos - x) * (abs(pos - x) + 1) // 2
+                for pos, count in poses.items()
+            ])
+            for x in range(min(poses), max(poses) + 1)
+        ])
+
 
 if __name__ == '__main__':
     Puzzle().solve()
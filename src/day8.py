@@ -1,6 +1,5 @@
 from dataclasses import dataclass
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Set, Union
+from typing import Dict, FrozenSet, List, Union
 
 import aoc
 
@@ -85,7 +84,7 @@ class Puzzle(aoc.Puzzle):
         return res
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        inputs = self.parse_input(inp)
+        inputs = self.parsed(inp, mutable=False)
         return sum(
             1
             for input in inputs
@@ -93,8 +92,16 @@ class Puzzle(aoc.Puzzle):
             if len(output) in (2, 3, 4, 7)
         )
 
+    def solve_part1_stream(self, inp: aoc.InputStream) -> Union[int, str, float]:
+        return sum(
+            1
+            for line in inp.lines()
+            for output in line.split("|", 1)[1].split()
+            if len(output) in (2, 3, 4, 7)
+        )
+
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        inputs = self.parse_input(inp)
+        inputs = self.parsed(inp)
         return sum(
             self.solve_for_input(input.digits, input.outputs)
             for input in inputs
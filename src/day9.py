@@ -1,14 +1,14 @@
+from __future__ import annotations
+
 import operator
 from dataclasses import dataclass
 from functools import reduce
-from operator import itemgetter
-from pprint import pprint
-from typing import Dict, FrozenSet, List, Set, Union
-
-import numpy as np
-import numpy.ma as ma
+from typing import List, Union
 
 import aoc
+from aoc import grid
+
+np = aoc.lazy_import("numpy")
 
 
 @dataclass
@@ -78,22 +78,21 @@ class Puzzle(aoc.Puzzle):
         9899965678"""
     EXAMPLE_SOLUTION_PART1 = 15
     EXAMPLE_SOLUTION_PART2 = 1134
+    SHARE_PARSED = True
+    PERSIST = True
 
     def parse_input(self, inp: str) -> Map:
-        return Map(np.array([
-            [int(cell) for cell in row]
-            for row in inp.split("\n")
-        ]))
+        return Map(grid.digit_grid(inp))
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        map = self.parse_input(inp)
+        map = self.parsed(inp, mutable=False)
         return sum(
-            map.m[pos.x][pos.y] + 1
+            int(map.m[pos.x][pos.y]) + 1
             for pos in map.low_points()
         )
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        map = self.parse_input(inp)
+        map = self.parsed(inp, mutable=False)
 
         basins = []
         filter = map.m < 9
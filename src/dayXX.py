@@ -12,11 +12,11 @@ class Puzzle(aoc.Puzzle):
         return inp.splitlines()
 
     def solve_part1(self, inp: str) -> Union[int, str, float]:
-        data = self.parse_input(inp)
+        data = self.parsed(inp)
         return 0
 
     def solve_part2(self, inp: str) -> Union[int, str, float]:
-        data = self.parse_input(inp)
+        data = self.parsed(inp)
         return 0
 
 
@@ -0,0 +1,96 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+BASELINES = Path(__file__).resolve().parent / "baselines.json"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("performance")
+    group.addoption(
+        "--perf", action="store_true",
+        help="run the timing tests, which are skipped by default")
+    group.addoption(
+        "--update-baselines", action="store_true",
+        help="write the measured times to baselines.json instead of "
+             "comparing against it")
+    group.addoption(
+        "--perf-tolerance", type=float, default=0.5,
+        help="allowed slowdown relative to the baseline (default: 0.5)")
+    group.addoption(
+        "--perf-repeat", type=int, default=3,
+        help="timed runs per part, the best one counts (default: 3)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "perf: timing test compared against baselines.json")
+
+
+def pytest_collection_modifyitems(config, items):
+    # timings are only meaningful on an otherwise idle machine
+    if config.getoption("--perf") or config.getoption("--update-baselines"):
+        return
+    skip = pytest.mark.skip(reason="timing test, run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
+
+
+def calibrate() -> float:
+    """
+    Best-of-5 time of a fixed pure Python workload, used to scale baselines
+    recorded on a faster or slower machine.
+    """
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        total = 0
+        for i in range(200_000):
+            total += i * i % 7
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class Baselines:
+    def __init__(self, path: Path, update: bool):
+        self.path = path
+        self.update = update
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            data = {"calibration": None, "parts": {}}
+        self.calibration = data["calibration"]
+        self.parts = data["parts"]
+        self.speed = 1.0
+        if self.update:
+            self.calibration = calibrate()
+        elif self.calibration:
+            self.speed = calibrate() / self.calibration
+
+    def get(self, key: str):
+        return self.parts.get(key)
+
+    def record(self, key: str, solution, wall_time: float) -> None:
+        self.parts[key] = {"solution": solution, "wall_time": wall_time}
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps({
+            "calibration": self.calibration,
+            "parts": dict(sorted(self.parts.items())),
+        }, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def baselines(request):
+    baselines = Baselines(
+        BASELINES, request.config.getoption("--update-baselines"))
+    yield baselines
+    if baselines.update:
+        baselines.save()
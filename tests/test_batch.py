@@ -0,0 +1,24 @@
+import textwrap
+
+from aoc.batch import solve_many
+from day9 import Puzzle
+
+
+def test_bad_inputs_do_not_stop_batch(tmp_path):
+    example = textwrap.dedent(Puzzle.EXAMPLE).strip()
+    # more bad inputs up front than are parsed ahead of the workers
+    for index in range(5):
+        (tmp_path / f"a{index}.txt").write_text(example + "\n123")
+    for index in range(2):
+        (tmp_path / f"b{index}.txt").write_text(example)
+
+    results = solve_many(Puzzle, tmp_path, jobs=1)
+
+    assert [result.path for result in results] == [
+        str(path) for path in sorted(tmp_path.glob("*.txt"))
+    ]
+    assert all(
+        "grid rows differ in length" in result.error for result in results[:5])
+    assert [
+        [part.solution for part in result.parts] for result in results[5:]
+    ] == [[15, 1134], [15, 1134]]
@@ -0,0 +1,47 @@
+import functools
+from random import Random
+
+import pytest
+
+from aoc import InputStream
+from day2 import Puzzle, Summary, parse_columns, summarize
+
+
+@pytest.mark.parametrize("inp", [
+    b"forward 5\ndown 12\nup 3",
+    b"forward 5\ndown 12\nup 3\n",
+    b"forward 5\n\ndown 12\n\n\nup 3\n\n",
+])
+def test_parse_columns_skips_empty_lines(inp):
+    commands = parse_columns(inp)
+    assert bytes(commands.op) == b"fdu"
+    assert commands.value.tolist() == [5, 12, 3]
+
+
+def test_parse_columns_crlf():
+    commands = parse_columns(b"forward 5\r\ndown 12\r\nup 3\r\n")
+    assert bytes(commands.op) == b"fdu"
+    assert commands.value.tolist() == [5, 12, 3]
+
+
+def test_parse_columns_empty():
+    commands = parse_columns(b"\n")
+    assert len(commands.op) == len(commands.value) == 0
+
+
+def test_parse_columns_unknown_command():
+    with pytest.raises(RuntimeError, match="^back 1$"):
+        parse_columns(b"forward 5\nback 1\n")
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("chunk_size", [1, 13, 64, 1 << 20])
+def test_summaries_of_chunks(newline, chunk_size):
+    inp = Puzzle().generate(500, Random(0))
+    stream = InputStream.from_text(inp.replace("\n", newline))
+    summary = functools.reduce(
+        Summary.then,
+        (summarize(stream.read(*span)) for span in stream.spans(chunk_size)),
+        Summary())
+    assert summary.horizontal * summary.aim == Puzzle().solve_part1_objects(inp)
+    assert summary.horizontal * summary.depth == Puzzle().solve_part2_objects(inp)
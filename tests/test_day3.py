@@ -0,0 +1,26 @@
+from day3 import add_counts, bit_matrix, count_ones
+
+
+def test_bit_matrix_crlf():
+    assert bit_matrix(b"101\r\n011").tolist() == \
+        bit_matrix(b"101\n011").tolist() == \
+        [[True, False, True], [False, True, True]]
+    assert bit_matrix("101\r\n011").tolist() == \
+        [[True, False, True], [False, True, True]]
+
+
+def test_count_ones_crlf():
+    ones, total = count_ones(b"101\r\n011\r\n")
+    assert ones.tolist() == [1, 1, 2]
+    assert total == 2
+
+
+def test_count_ones_empty_chunks():
+    assert count_ones(b"") == (0, 0)
+    assert count_ones(b"\r\n") == (0, 0)
+
+    counts = (0, 0)
+    for chunk in (b"", b"101\n", b"\n", b"011\r\n", b""):
+        counts = add_counts(counts, count_ones(chunk))
+    assert counts[0].tolist() == [1, 1, 2]
+    assert counts[1] == 2
@@ -0,0 +1,10 @@
+import importlib
+
+import pytest
+
+from aoc.runner import find_puzzles
+
+
+@pytest.mark.parametrize("module", find_puzzles())
+def test_examples(module):
+    importlib.import_module(module).Puzzle()._check_examples()
@@ -0,0 +1,28 @@
+import pytest
+
+from aoc.grid import byte_grid, char_grid, digit_grid
+
+
+def test_byte_grid():
+    grid = byte_grid(b"ab\ncd")
+    assert grid.shape == (2, 2)
+    assert bytes(grid[1]) == b"cd"
+    assert not grid.flags.writeable
+
+
+def test_byte_grid_empty():
+    assert byte_grid(b"").shape == (0, 0)
+    assert byte_grid("").shape == (0, 0)
+    assert digit_grid(b"").shape == (0, 0)
+    assert char_grid(b"").shape == (0, 0)
+
+
+@pytest.mark.parametrize("inp", [b"ab\ncde", b"abc\nde", b"ab\n\ncd", b"ab\ncd\n"])
+def test_byte_grid_ragged(inp):
+    with pytest.raises(ValueError, match="grid rows differ in length"):
+        byte_grid(inp)
+
+
+def test_digit_grid_non_digits():
+    with pytest.raises(ValueError, match="non-digits"):
+        digit_grid(b"12\n3a")
@@ -0,0 +1,85 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aoc.inputs import InputStore
+
+INPUTS = {1: b"199\n200\n208\n", 2: b"forward 5\ndown 5\n", 3: b"00100\n11110\n"}
+
+
+class InputHandler(BaseHTTPRequestHandler):
+    requested = []
+
+    def do_GET(self):
+        self.requested.append((self.path, self.headers.get("Cookie")))
+        day = int(self.path.rsplit("/", 2)[-2])
+        if self.path != f"/2021/day/{day}/input" or day not in INPUTS:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(INPUTS[day])))
+        self.end_headers()
+        self.wfile.write(INPUTS[day])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    InputHandler.requested = []
+    with ThreadingHTTPServer(("127.0.0.1", 0), InputHandler) as server:
+        thread = threading.Thread(
+            target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}/"
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_prefetch(server, tmp_path):
+    store = InputStore(
+        2021, root=tmp_path, base_url=server, session_cookie="secret")
+    paths = store.prefetch([1, 2, 3], jobs=2)
+
+    for day, content in INPUTS.items():
+        assert paths[day] == store.path(day)
+        assert paths[day].read_bytes() == content
+        # stored under the digest of the content
+        assert paths[day].name == hashlib.sha256(content).hexdigest()
+    assert sorted(InputHandler.requested) == [
+        (f"/2021/day/{day}/input", "session=secret") for day in (1, 2, 3)
+    ]
+
+
+def test_prefetch_skips_cached_days(server, tmp_path):
+    store = InputStore(2021, root=tmp_path, base_url=server)
+    store.put(1, INPUTS[1])
+    store.put(2, b"stale, but cached")
+
+    paths = store.prefetch([1, 2, 3])
+
+    assert [path for path, _ in InputHandler.requested] == ["/2021/day/3/input"]
+    assert paths[2].read_bytes() == b"stale, but cached"
+    assert store.get(3) == INPUTS[3].decode()
+    assert store.missing([1, 2, 3, 4]) == [4]
+
+
+def test_prefetch_all_cached(tmp_path):
+    # no server needed when nothing is missing
+    store = InputStore(2021, root=tmp_path, base_url="http://127.0.0.1:9/")
+    store.put(1, INPUTS[1])
+    assert store.prefetch([1]) == {1: store.path(1)}
+
+
+def test_fetch_error(server, tmp_path):
+    import requests
+
+    store = InputStore(2021, root=tmp_path, base_url=server)
+    with pytest.raises(requests.HTTPError):
+        store.prefetch([25])
+    assert store.path(25) is None
@@ -0,0 +1,41 @@
+import importlib
+import os
+from random import Random
+
+import pytest
+
+from aoc import PARSE, parallel
+
+
+def _day2_input() -> str:
+    return importlib.import_module("day2").Puzzle().generate(2000, Random(0))
+
+
+def _day3_input() -> str:
+    # every 12 bit number once, so no bit is the same in all remaining rows
+    numbers = Random(0).sample(range(1 << 12), 1 << 12)
+    return "\n".join(f"{number:012b}" for number in numbers)
+
+
+@pytest.mark.parametrize("module, make_input", [
+    ("day2", _day2_input),
+    ("day3", _day3_input),
+])
+def test_stream_parts_in_supervised_child(module, make_input, tmp_path, monkeypatch):
+    puzzle_cls = importlib.import_module(module).Puzzle
+    path = tmp_path / f"{module}.txt"
+    path.write_text(make_input(), encoding="utf-8")
+    monkeypatch.setattr(puzzle_cls, "input_path", lambda self: path)
+    expected = [result.solution for result in puzzle_cls().run(examples="skip")]
+
+    # several chunks and workers, even on a single core machine
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(parallel, "CHUNK_SIZE", 1024)
+    for options in ({"timeout": 60}, {"concurrent": True}):
+        results = [
+            result
+            for result in puzzle_cls().run(stream=True, examples="skip", **options)
+            if result.part != PARSE
+        ]
+        assert [result.error for result in results] == [None] * len(results)
+        assert [result.solution for result in results] == expected
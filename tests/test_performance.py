@@ -0,0 +1,59 @@
+import importlib
+from random import Random
+
+import pytest
+
+from aoc import _plain
+from aoc.bench import BenchmarkOptions, measure
+from aoc.runner import find_puzzles
+
+# parts that finish within this many seconds are too noisy to compare
+ABSOLUTE_SLACK = 0.005
+
+
+def _cases():
+    # real inputs differ between users, so only generated ones are compared
+    for module in find_puzzles():
+        puzzle_cls = importlib.import_module(module).Puzzle
+        if not puzzle_cls.SWEEP_SCALES:
+            continue
+        for part in puzzle_cls.parts():
+            yield pytest.param(module, part, id=f"{module}-{part}-generated")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("module, part", list(_cases()))
+def test_performance(module, part, baselines, request):
+    puzzle_cls = importlib.import_module(module).Puzzle
+    scale = puzzle_cls.SWEEP_SCALES[-1]
+    inp = puzzle_cls().generate(scale, Random(0)).strip()
+
+    def best_time(repeat: int):
+        # a new instance per call, so parsing is part of the measurement
+        solution, stats, _ = measure(
+            lambda: getattr(puzzle_cls(), f"solve_part{part}")(inp),
+            BenchmarkOptions(warmup=1, repeat=repeat))
+        return _plain(solution), stats.min
+
+    repeat = request.config.getoption("--perf-repeat")
+    solution, wall_time = best_time(repeat)
+
+    key = f"{module}-{part}-generated"
+    if baselines.update:
+        baselines.record(key, solution, wall_time)
+        return
+
+    baseline = baselines.get(key)
+    if baseline is None:
+        pytest.skip(f"no baseline for {key}, run with --update-baselines")
+
+    assert solution == baseline["solution"]
+
+    tolerance = request.config.getoption("--perf-tolerance")
+    limit = baseline["wall_time"] * baselines.speed * (1 + tolerance)
+    if wall_time > limit + ABSOLUTE_SLACK:
+        # rule out a burst of load on the machine before failing
+        wall_time = min(wall_time, best_time(2 * repeat)[1])
+    assert wall_time <= limit + ABSOLUTE_SLACK, \
+        f"{key} took {wall_time:.4f}s, baseline " \
+        f"{baseline['wall_time']:.4f}s (limit {limit:.4f}s)"
@@ -0,0 +1,40 @@
+import pytest
+
+from aoc import InputStream
+
+TEXT = "forward 12\r\ndown 3\nup 456\n\nforward 7890\n"
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(TEXT) + 2))
+def test_spans_end_after_newlines(chunk_size):
+    stream = InputStream.from_text(TEXT)
+    spans = stream.spans(chunk_size)
+
+    assert b"".join(stream.read(*span) for span in spans) == TEXT.encode()
+    assert all(end == start for (_, end), (start, _) in zip(spans, spans[1:]))
+    assert all(stream.read(*span).endswith(b"\n") for span in spans)
+
+
+def test_spans_without_final_newline(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"up 1\ndown 2")
+    stream = InputStream.from_path(path)
+    assert [stream.read(*span) for span in stream.spans(3)] == [
+        b"up 1\n", b"down 2",
+    ]
+
+
+def test_spans_empty(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+    assert InputStream.from_path(path).spans(3) == []
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_ints_at_chunk_boundaries(chunk_size, tmp_path, monkeypatch):
+    monkeypatch.setattr("aoc.stream.CHUNK_SIZE", chunk_size)
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"12345 6,-78\n-9 1234567890123")
+    expected = [12345, 6, -78, -9, 1234567890123]
+    assert list(InputStream.from_path(path).ints()) == expected
+    assert list(InputStream.from_text(path.read_text()).ints()) == expected